@@ -1,51 +1,69 @@
 from __future__ import annotations
 
+from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import aiohttp
 
-from .config import BASE, cached_api_call
+from .config import BASE, cached_api_call, rounds_cache, roster_cache
 from .http import fetch_json
 
 
-@cached_api_call(lambda session, league_slug: f"rounds:{league_slug}")
+@cached_api_call(lambda session, league_slug: f"rounds:{league_slug}", cache=rounds_cache)
 async def get_rounds(session: aiohttp.ClientSession, league_slug: str) -> List[Dict[str, Any]]:
-    data = await fetch_json(session, f"{BASE}/leagues/{league_slug}/rounds")
+    data = await fetch_json(session, f"{BASE}/leagues/{league_slug}/rounds", conditional=True)
     return data.get("data", [])
 
 
 def pick_current_round(rounds: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    inprog = [r for r in rounds if r.get("status") == "in_progress"]
-    if inprog:
-        inprog.sort(key=lambda r: r.get("indexInSplit", -1), reverse=True)
-        return inprog[0]
-    return None
+    # Single pass with a running max: no intermediate list, no sort
+    best: Optional[Dict[str, Any]] = None
+    best_idx = 0
+    for r in rounds:
+        if r.get("status") == "in_progress":
+            idx = r.get("indexInSplit", -1)
+            if best is None or idx > best_idx:
+                best, best_idx = r, idx
+    return best
 
 
 def pick_latest_round(rounds: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    inprog = [r for r in rounds if r.get("status") == "in_progress"]
-    if inprog:
-        inprog.sort(key=lambda r: r.get("indexInSplit", -1), reverse=True)
-        return inprog[0]
-
-    def ts(r: Dict[str, Any]) -> float:
-        s = r.get("marketClosesAt") or ""
-        try:
-            from datetime import datetime
-            return datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()
-        except Exception:
-            return 0.0
-
-    return sorted(rounds, key=ts, reverse=True)[0] if rounds else None
+    # One pass: prefer the in-progress round with the highest indexInSplit, else the
+    # round whose market closes last. Timestamps are only parsed until an in-progress
+    # round turns up; ties keep the first round, as the old sorts did.
+    best_inprog: Optional[Dict[str, Any]] = None
+    best_idx = 0
+    best_fallback: Optional[Dict[str, Any]] = None
+    best_ts = 0.0
+    for r in rounds:
+        if r.get("status") == "in_progress":
+            idx = r.get("indexInSplit", -1)
+            if best_inprog is None or idx > best_idx:
+                best_inprog, best_idx = r, idx
+        elif best_inprog is None:
+            ts = _market_close_ts(r.get("marketClosesAt") or "")
+            if best_fallback is None or ts > best_ts:
+                best_fallback, best_ts = r, ts
+    return best_inprog or best_fallback
+
+
+@lru_cache(maxsize=256)
+def _market_close_ts(s: str) -> float:
+    # Memoized: the same handful of round timestamps is parsed on every poll
+    try:
+        return datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
 
 
 @cached_api_call(lambda session, league_slug, round_id: f"ranking:{league_slug}:{round_id}")
 async def get_league_ranking(session: aiohttp.ClientSession, league_slug: str, round_id: str) -> List[Dict[str, Any]]:
-    data = await fetch_json(session, f"{BASE}/leagues/{league_slug}/ranking", params={"roundId": round_id, "orderBy": "split_score"})
+    data = await fetch_json(session, f"{BASE}/leagues/{league_slug}/ranking", params={"roundId": round_id, "orderBy": "split_score"}, conditional=True)
     return data.get("data", [])
 
 
-@cached_api_call(lambda session, round_id, team_id: f"roster:{round_id}:{team_id}")
+@cached_api_call(lambda session, round_id, team_id: f"roster:{round_id}:{team_id}", cache=roster_cache)
 async def get_team_round_roster(session: aiohttp.ClientSession, round_id: str, team_id: str) -> Dict[str, Any]:
     try:
         data = await fetch_json(session, f"{BASE}/rosters/per-round/{round_id}/{team_id}")
@@ -79,16 +97,18 @@ async def find_team_by_name_or_owner(session: aiohttp.ClientSession, league_slug
     ranking = await get_league_ranking(session, league_slug, round_id)
 
     search_term_lower = search_term.lower()
+    field = {"team": "name", "owner": "ownerName"}.get(search_type)
+    if field is None:
+        return None
 
-    for item in ranking:
-        team_name = item["userTeam"]["name"].lower()
-        owner_name = (item["userTeam"].get("ownerName") or "").lower()
-
-        if ((search_type == "team" and search_term_lower in team_name) or 
-            (search_type == "owner" and search_term_lower in owner_name)):
-            return {"team_info": item, "round_obj": round_obj, "round_id": round_id}
-
-    return None
+    # Lowercase only the searched field; an exact match wins over the first substring match
+    candidates = [(item, (item["userTeam"].get(field) or "").lower()) for item in ranking]
+    match = next((item for item, value in candidates if value == search_term_lower), None)
+    if match is None:
+        match = next((item for item, value in candidates if search_term_lower in value), None)
+    if match is None:
+        return None
+    return {"team_info": match, "round_obj": round_obj, "round_id": round_id}
 
 
 def pick_previous_round(rounds: List[Dict[str, Any]], current_round: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 from telegram import BotCommand, BotCommandScopeAllPrivateChats
 from telegram.ext import Application, CommandHandler
 from telegram.request import HTTPXRequest
 
-from .config import BOT_TOKEN, X_SESSION_TOKEN, logger
+from .config import BOT_TOKEN, X_SESSION_TOKEN, WEBHOOK_URL, WEBHOOK_PORT, WEBHOOK_SECRET, logger
 from .storage import (
     load_group_settings,
     load_runtime_state,
     get_active_chats_to_resume,
     get_group_league,
+    load_commands_hash,
+    save_commands_hash,
 )
 from .watchers import WATCHERS
 from .commands import (
@@ -29,10 +32,58 @@ from .commands import (
 )
 
 
+PRIVATE_COMMANDS = (
+    BotCommand("start", "Show help and available commands"),
+    BotCommand("scores", "Get standings for a specific league"),
+    BotCommand("team", "Get detailed team information"),
+    BotCommand("owner", "Find team by owner name"),
+    BotCommand("watch", "Monitor a specific league for updates"),
+    BotCommand("unwatch", "Stop monitoring"),
+    BotCommand("auth", "Update session token"),
+)
+
+GROUP_COMMANDS = (
+    BotCommand("start", "Show help and available commands"),
+    BotCommand("scores", "Get standings for group's league"),
+    BotCommand("team", "Get detailed team information"),
+    BotCommand("owner", "Find team by owner name"),
+    BotCommand("setleague", "Attach a league to this group"),
+    BotCommand("getleague", "Show current attached league"),
+    BotCommand("startwatch", "Start monitoring group's league"),
+    BotCommand("stopwatch", "Stop monitoring"),
+)
+
+
+COMMAND_HANDLERS = (
+    ("start", start_cmd),
+    ("scores", scores_cmd),
+    ("team", team_cmd),
+    ("owner", owner_cmd),
+    ("watchstatus", watchstatus_cmd),
+    ("setleague", setleague_cmd),
+    ("getleague", getleague_cmd),
+    ("startwatch", startwatch_cmd),
+    ("stopwatch", stopwatch_cmd),
+    ("watch", watch_cmd),
+    ("unwatch", unwatch_cmd),
+    ("auth", auth_cmd),
+)
+
+
+def _commands_hash(bot_id: int) -> str:
+    """Digest of both command menus for this bot, to skip re-registering unchanged menus."""
+    menus = (
+        bot_id,
+        [(c.command, c.description) for c in GROUP_COMMANDS],
+        [(c.command, c.description) for c in PRIVATE_COMMANDS],
+    )
+    return hashlib.blake2b(repr(menus).encode("utf-8"), digest_size=16).hexdigest()
+
+
 async def startup_health_check():
     """Perform health check on bot startup"""
     from .config import BASE, X_SESSION_TOKEN, logger
-    from .http import make_session, fetch_json
+    from .http import get_session, fetch_json
     from .champions import load_champion_data
     
     logger.info("🏥 Running startup health check...")
@@ -47,21 +98,21 @@ async def startup_health_check():
     
     try:
         # Test LTA Fantasy authentication
-        async with make_session() as session:
-            user_data = await fetch_json(session, f'{BASE}/users/me')
-            
-            if user_data and 'data' in user_data:
-                user_info = user_data['data']
-                display_name = user_info.get('riotGameName', 'Unknown')
-                tag_line = user_info.get('riotTagLine', 'Unknown')
-                
-                logger.info(f"✅ Authenticated as: {display_name}#{tag_line}")
-                logger.info("✅ LTA Fantasy API authentication successful")
-                return True
-            else:
-                logger.error("❌ Invalid response from /users/me endpoint")
-                return False
-                
+        session = await get_session()
+        user_data = await fetch_json(session, f'{BASE}/users/me')
+        
+        if user_data and 'data' in user_data:
+            user_info = user_data['data']
+            display_name = user_info.get('riotGameName', 'Unknown')
+            tag_line = user_info.get('riotTagLine', 'Unknown')
+        
+            logger.info(f"✅ Authenticated as: {display_name}#{tag_line}")
+            logger.info("✅ LTA Fantasy API authentication successful")
+            return True
+        else:
+            logger.error("❌ Invalid response from /users/me endpoint")
+            return False
+        
     except Exception as e:
         error_msg = str(e)
         if '401' in error_msg or 'Unauthorized' in error_msg:
@@ -75,14 +126,28 @@ async def startup_health_check():
 
 
 def main():
+    try:
+        import uvloop
+        # libuv-backed loop; run_polling/run_webhook pick it up through the policy
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        # Fall back to the default asyncio loop when uvloop isn't installed
+        pass
+
     load_group_settings()
     load_runtime_state()
 
-    if not BOT_TOKEN:
-        raise SystemExit("❌ BOT_TOKEN not set. Check your .env file.")
-
-    # Configure request with longer timeout to prevent startup failures
+    # Configure request with longer timeout to prevent startup failures.
+    # The pool is sized for many watched chats editing messages at once.
     request = HTTPXRequest(
+        connection_pool_size=64,
+        connect_timeout=30.0,
+        read_timeout=30.0,
+        write_timeout=30.0,
+        pool_timeout=10.0,
+    )
+    # getUpdates gets its own small pool so long polls never hold up sends/edits
+    updates_request = HTTPXRequest(
         connection_pool_size=8,
         connect_timeout=30.0,
         read_timeout=30.0,
@@ -90,28 +155,15 @@ def main():
         pool_timeout=30.0,
     )
     
-    app = Application.builder().token(BOT_TOKEN).request(request).build()
-
-    private_commands = [
-        BotCommand("start", "Show help and available commands"),
-        BotCommand("scores", "Get standings for a specific league"),
-        BotCommand("team", "Get detailed team information"),
-        BotCommand("owner", "Find team by owner name"),
-        BotCommand("watch", "Monitor a specific league for updates"),
-        BotCommand("unwatch", "Stop monitoring"),
-        BotCommand("auth", "Update session token"),
-    ]
-
-    group_commands = [
-        BotCommand("start", "Show help and available commands"),
-        BotCommand("scores", "Get standings for group's league"),
-        BotCommand("team", "Get detailed team information"),
-        BotCommand("owner", "Find team by owner name"),
-        BotCommand("setleague", "Attach a league to this group"),
-        BotCommand("getleague", "Show current attached league"),
-        BotCommand("startwatch", "Start monitoring group's league"),
-        BotCommand("stopwatch", "Stop monitoring"),
-    ]
+    app = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .request(request)
+        .get_updates_request(updates_request)
+        # Slow commands (/scores with charts) don't block other chats' commands
+        .concurrent_updates(True)
+        .build()
+    )
 
     def resume_watchers(application: Application) -> None:
         from .watchers import start_watcher
@@ -119,39 +171,69 @@ def main():
         chats_to_resume = get_active_chats_to_resume()
         if not chats_to_resume:
             return
+        # League lookups are in-memory and start_watcher only schedules a task, so all
+        # watchers start in one pass and their first polls run concurrently.
+        # A bad entry must not keep the remaining chats from resuming.
+        resumed = 0
         for chat_id in chats_to_resume:
-            league = get_group_league(chat_id)
-            if not league:
-                continue
-            # Use the new state machine watcher
-            start_watcher(chat_id, league, application.bot)
+            try:
+                league = get_group_league(chat_id)
+                if not league:
+                    continue
+                # Use the new state machine watcher
+                start_watcher(chat_id, league, application.bot)
+                resumed += 1
+            except Exception as e:
+                logger.error(f"❌ Failed to resume watcher for chat {chat_id}: {e}")
+        logger.info(f"🔁 Resumed {resumed}/{len(chats_to_resume)} watchers")
 
     async def post_init(application: Application) -> None:
+        from .http import get_session
+        # Open the shared API session up front so resumed watchers start on a warm pool
+        await get_session()
+
         try:
-            logger.info("🔧 Setting up bot commands...")
-            await application.bot.set_my_commands(group_commands)
-            await application.bot.set_my_commands(private_commands, scope=BotCommandScopeAllPrivateChats())
-            logger.info("✅ Bot commands configured successfully")
+            digest = _commands_hash(application.bot.id)
+            if digest == load_commands_hash():
+                logger.info("✅ Bot commands unchanged, skipping registration")
+            else:
+                logger.info("🔧 Setting up bot commands...")
+                # Default and private-chat scopes are independent, so register both at once
+                await asyncio.gather(
+                    application.bot.set_my_commands(GROUP_COMMANDS),
+                    application.bot.set_my_commands(PRIVATE_COMMANDS, scope=BotCommandScopeAllPrivateChats()),
+                )
+                save_commands_hash(digest)
+                logger.info("✅ Bot commands configured successfully")
         except Exception as e:
             logger.error(f"❌ Failed to set bot commands: {e}")
             logger.warning("⚠️ Bot will continue but commands may not be visible in Telegram")
-        
-        await asyncio.sleep(2)
+
+        # post_init runs after Application.initialize(), so the bot is ready to send;
+        # resume_watchers only schedules tasks and they run alongside polling startup
         resume_watchers(application)
 
+    async def post_shutdown(application: Application) -> None:
+        from .http import close_session
+        from .storage import flush_runtime_state_save
+        flush_runtime_state_save()
+        await close_session()
+
     app.post_init = post_init
+    app.post_shutdown = post_shutdown
+
+    app.add_handlers([CommandHandler(name, callback) for name, callback in COMMAND_HANDLERS])
 
-    app.add_handler(CommandHandler("start", start_cmd))
-    app.add_handler(CommandHandler("scores", scores_cmd))
-    app.add_handler(CommandHandler("team", team_cmd))
-    app.add_handler(CommandHandler("owner", owner_cmd))
-    app.add_handler(CommandHandler("watchstatus", watchstatus_cmd))
-    app.add_handler(CommandHandler("setleague", setleague_cmd))
-    app.add_handler(CommandHandler("getleague", getleague_cmd))
-    app.add_handler(CommandHandler("startwatch", startwatch_cmd))
-    app.add_handler(CommandHandler("stopwatch", stopwatch_cmd))
-    app.add_handler(CommandHandler("watch", watch_cmd))
-    app.add_handler(CommandHandler("unwatch", unwatch_cmd))
-    app.add_handler(CommandHandler("auth", auth_cmd))
-
-    app.run_polling(drop_pending_updates=True)
+    if WEBHOOK_URL:
+        # Telegram pushes updates to us; no idle getUpdates round-trips
+        logger.info(f"🌐 Starting webhook on port {WEBHOOK_PORT}")
+        app.run_webhook(
+            listen="0.0.0.0",
+            port=WEBHOOK_PORT,
+            url_path=BOT_TOKEN,
+            secret_token=WEBHOOK_SECRET or None,
+            webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{BOT_TOKEN}",
+            drop_pending_updates=True,
+        )
+    else:
+        app.run_polling(drop_pending_updates=True)
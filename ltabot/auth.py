@@ -1,33 +1,48 @@
 from __future__ import annotations
 
+from typing import Optional
+
+from cachetools import TTLCache
 from telegram import Update, ChatMember
 from telegram.ext import ContextTypes
 
 from .config import ALLOWED_USER_ID
 
 
-async def is_group_member(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
+# Chat member status per (chat_id, user_id); role changes are rare, so a short TTL is safe
+member_status_cache: TTLCache = TTLCache(maxsize=1000, ttl=60)
+
+
+async def get_member_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Optional[str]:
+    """Return the user's status in the current chat, or None if it can't be fetched."""
     if not update.effective_chat or not update.effective_user:
-        return False
-    chat_id = update.effective_chat.id
-    user_id = update.effective_user.id
-    try:
-        member = await context.bot.get_chat_member(chat_id, user_id)
-        return member.status in [ChatMember.MEMBER, ChatMember.ADMINISTRATOR, ChatMember.OWNER]
-    except Exception:
-        return False
+        return None
+    key = (update.effective_chat.id, update.effective_user.id)
+    status = member_status_cache.get(key)
+    if status is None:
+        try:
+            member = await context.bot.get_chat_member(*key)
+        except Exception:
+            return None
+        status = member.status
+        member_status_cache[key] = status
+    return status
+
+
+def invalidate_member_cache(chat_id: int) -> None:
+    """Drop cached member statuses for a chat (e.g. after a role change)."""
+    for key in [k for k in member_status_cache.keys() if k[0] == chat_id]:
+        member_status_cache.pop(key, None)
+
+
+async def is_group_member(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
+    status = await get_member_status(update, context)
+    return status in [ChatMember.MEMBER, ChatMember.ADMINISTRATOR, ChatMember.OWNER]
 
 
 async def is_group_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
-    if not update.effective_chat or not update.effective_user:
-        return False
-    chat_id = update.effective_chat.id
-    user_id = update.effective_user.id
-    try:
-        member = await context.bot.get_chat_member(chat_id, user_id)
-        return member.status in [ChatMember.ADMINISTRATOR, ChatMember.OWNER]
-    except Exception:
-        return False
+    status = await get_member_status(update, context)
+    return status in [ChatMember.ADMINISTRATOR, ChatMember.OWNER]
 
 
 async def is_authorized_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
@@ -12,6 +12,8 @@ from typing import Dict, Optional
 from functools import wraps
 from cachetools import TTLCache
 
+from .http import get_session, json_loads
+
 logger = logging.getLogger(__name__)
 
 # Champion Configuration
@@ -35,16 +37,16 @@ def cached_champion_call(cache_key_func):
             
             # Check cache first
             if key in champion_cache:
-                logger.debug(f"Champion cache hit for: {key}")
+                logger.debug("Champion cache hit for: %s", key)
                 return champion_cache[key]
             
             # Call original function
-            logger.debug(f"Champion cache miss, calling API for: {key}")
+            logger.debug("Champion cache miss, calling API for: %s", key)
             result = await func(*args, **kwargs)
             
             # Store in cache
             champion_cache[key] = result
-            logger.debug(f"Cached champion result for: {key}")
+            logger.debug("Cached champion result for: %s", key)
             return result
         return wrapper
     return decorator
@@ -59,25 +61,26 @@ async def load_champion_data() -> Dict[str, str]:
     """
     try:
         timeout = aiohttp.ClientTimeout(total=CHAMPION_API_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            logger.debug(f"Fetching champion data from: {CHAMPION_API_URL}")
-            async with session.get(CHAMPION_API_URL) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # Build mapping from champion ID to name
-                    champion_mapping = {}
-                    for champion_key, champion_info in data['data'].items():
-                        champion_id = str(champion_info['key'])  # Convert to string for consistency
-                        champion_name = champion_info['name']
-                        champion_mapping[champion_id] = champion_name
-                    
-                    logger.info(f"✅ Loaded {len(champion_mapping)} champions from Riot Data Dragon (cached for {CHAMPION_CACHE_TTL//3600}h)")
-                    return champion_mapping
-                else:
-                    logger.error(f"Failed to fetch champion data: HTTP {response.status}")
-                    return {}
-                    
+        # Reuse the shared pooled session; the LTA token is only sent by fetch_json, never here
+        session = await get_session()
+        logger.debug("Fetching champion data from: %s", CHAMPION_API_URL)
+        async with session.get(CHAMPION_API_URL, timeout=timeout) as response:
+            if response.status == 200:
+                data = json_loads(await response.read())
+                
+                # Build mapping from champion ID to name
+                champion_mapping = {}
+                for champion_key, champion_info in data['data'].items():
+                    champion_id = str(champion_info['key'])  # Convert to string for consistency
+                    champion_name = champion_info['name']
+                    champion_mapping[champion_id] = champion_name
+                
+                logger.info(f"✅ Loaded {len(champion_mapping)} champions from Riot Data Dragon (cached for {CHAMPION_CACHE_TTL//3600}h)")
+                return champion_mapping
+            else:
+                logger.error(f"Failed to fetch champion data: HTTP {response.status}")
+                return {}
+                
     except Exception as e:
         logger.error(f"Error loading champion data: {e}")
         return {}
@@ -1,6 +1,7 @@
 """
 Chart generation utilities for LTA Fantasy Bot.
 """
+import asyncio
 import io
 from typing import Dict, List, Tuple, Any, Optional
 from .config import logger
@@ -83,6 +84,7 @@ async def get_all_teams_round_stats(session, league: str) -> Dict[str, Dict[int,
         Dict[team_name, Dict[round_index, cumulative_score]]
     """
     from .api import get_rounds, get_league_ranking, get_user_team_round_stats, get_team_round_roster, pick_latest_round
+    from .watchers import ROSTER_SEMAPHORE
     
     try:
         # Get team list from latest round
@@ -101,12 +103,11 @@ async def get_all_teams_round_stats(session, league: str) -> Dict[str, Dict[int,
         # Build team list with IDs and names
         teams_info = [(item["userTeam"]["id"], item["userTeam"]["name"]) for item in ranking]
         
-        teams_data: Dict[str, Dict[int, float]] = {}
-        
-        for team_id, team_name in teams_info:
+        async def get_team_progression(team_id: str, team_name: str) -> Dict[int, float]:
             try:
                 # Get all round stats for this team
-                round_stats = await get_user_team_round_stats(session, team_id)
+                async with ROSTER_SEMAPHORE:
+                    round_stats = await get_user_team_round_stats(session, team_id)
                 
                 team_progression = {}
                 cumulative_score = 0.0
@@ -125,7 +126,8 @@ async def get_all_teams_round_stats(session, league: str) -> Dict[str, Dict[int,
                             # Get live score for in_progress round
                             try:
                                 round_id = round_stat["id"]
-                                roster = await get_team_round_roster(session, round_id, team_id)
+                                async with ROSTER_SEMAPHORE:
+                                    roster = await get_team_round_roster(session, round_id, team_id)
                                 rr = roster.get("roundRoster") or {}
                                 live_pts = rr.get("pointsPartial")
                                 if live_pts is None:
@@ -136,11 +138,17 @@ async def get_all_teams_round_stats(session, league: str) -> Dict[str, Dict[int,
                         
                         team_progression[round_index] = cumulative_score
                 
-                teams_data[team_name] = team_progression
+                return team_progression
                 
             except Exception as e:
                 logger.warning(f"Could not get round stats for team {team_name} ({team_id}): {e}")
-                teams_data[team_name] = {}
+                return {}
+        
+        # Fetch all teams concurrently; the shared semaphore bounds in-flight requests
+        progressions = await asyncio.gather(*[get_team_progression(team_id, team_name) for team_id, team_name in teams_info])
+        teams_data: Dict[str, Dict[int, float]] = {
+            team_name: progression for (_, team_name), progression in zip(teams_info, progressions)
+        }
         
         logger.info(f"Retrieved round stats for {len(teams_data)} teams")
         return teams_data
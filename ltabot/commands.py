@@ -11,7 +11,7 @@ from .watchers import (
     gather_live_scores,
     start_watcher,
 )
-from .http import make_session
+from .http import get_session
 from .api import get_rounds
 from .storage import get_group_league, set_group_league
 from .config import logger
@@ -92,69 +92,69 @@ async def _send_scores_response(update: Update, league: str):
     """Send scores response with chart visualization and text data as caption."""
     from .watchers import gather_live_scores, calculate_partial_ranking
     from .api import get_rounds, pick_latest_round, determine_phase_from_round
-    from .http import make_session
+    from .http import get_session
     from .charts import generate_race_chart, get_all_teams_round_stats
     
     # Use a single session for all API calls to avoid duplicates
-    async with make_session() as session:
-        # Get current phase and prepare text data (single API call)
-        rounds = await get_rounds(session, league)
-        latest_round = pick_latest_round(rounds) if rounds else None
-        phase_name = determine_phase_from_round(latest_round)
-        
-        # For live, pre_market, and market_open phases, use calculated partial ranking only
-        if phase_name.lower() in ["live", "pre_market", "market_open"]:
-            try:
-                # Calculate partial ranking (will make optimized API calls)
-                _, partial_teams_data = await calculate_partial_ranking(league)
-                if partial_teams_data:
-                    from .formatting import fmt_standings
-                    # Create a fake round object for formatting
-                    fake_round = {"name": "Ranking Parcial", "status": phase_name.lower()}
-                    caption_text = fmt_standings(league, fake_round, partial_teams_data, score_type="Parcial")
-                    
-                    # Add warning prefix only for live phase
-                    if phase_name.lower() == "live":
-                        warning_prefix = "⚠️ <i>Live tournament - scores updating in real time</i>\n\n"
-                        caption_text = warning_prefix + caption_text
-                        
-                    # For chart data, reuse the same teams data if available
-                    # Get teams_data for chart generation (reuse session)
-                    teams_data = await get_all_teams_round_stats(session, league)
-                else:
-                    # Fallback to API ranking
-                    msg, _ = await gather_live_scores(league)
-                    caption_text = msg
-                    teams_data = await get_all_teams_round_stats(session, league)
-            except Exception as e:
-                # If there's an error calculating partial ranking, use API ranking
-                logger.warning(f"Failed to calculate partial ranking for /scores: {e}")
+    session = await get_session()
+    # Get current phase and prepare text data (single API call)
+    rounds = await get_rounds(session, league)
+    latest_round = pick_latest_round(rounds) if rounds else None
+    phase_name = determine_phase_from_round(latest_round)
+    
+    # For live, pre_market, and market_open phases, use calculated partial ranking only
+    if phase_name.lower() in ["live", "pre_market", "market_open"]:
+        try:
+            # Calculate partial ranking (will make optimized API calls)
+            _, partial_teams_data = await calculate_partial_ranking(league)
+            if partial_teams_data:
+                from .formatting import fmt_standings
+                # Create a fake round object for formatting
+                fake_round = {"name": "Ranking Parcial", "status": phase_name.lower()}
+                caption_text = fmt_standings(league, fake_round, partial_teams_data, score_type="Parcial")
+    
+                # Add warning prefix only for live phase
+                if phase_name.lower() == "live":
+                    warning_prefix = "⚠️ <i>Live tournament - scores updating in real time</i>\n\n"
+                    caption_text = warning_prefix + caption_text
+    
+                # For chart data, reuse the same teams data if available
+                # Get teams_data for chart generation (reuse session)
+                teams_data = await get_all_teams_round_stats(session, league)
+            else:
+                # Fallback to API ranking
                 msg, _ = await gather_live_scores(league)
                 caption_text = msg
                 teams_data = await get_all_teams_round_stats(session, league)
-        else:
-            # For other phases, use the standard API ranking
+        except Exception as e:
+            # If there's an error calculating partial ranking, use API ranking
+            logger.warning(f"Failed to calculate partial ranking for /scores: {e}")
             msg, _ = await gather_live_scores(league)
             caption_text = msg
             teams_data = await get_all_teams_round_stats(session, league)
-        
-        # Try to generate and send chart with text as caption
-        try:
-            if teams_data:
-                chart_buffer = generate_race_chart(teams_data)
-                if chart_buffer:
-                    await update.message.reply_photo(
-                        photo=chart_buffer,
-                        caption=caption_text,
-                        parse_mode="HTML"
-                    )
-                    return
-                else:
-                    logger.warning("Chart generation failed, falling back to text only")
+    else:
+        # For other phases, use the standard API ranking
+        msg, _ = await gather_live_scores(league)
+        caption_text = msg
+        teams_data = await get_all_teams_round_stats(session, league)
+    
+    # Try to generate and send chart with text as caption
+    try:
+        if teams_data:
+            chart_buffer = generate_race_chart(teams_data)
+            if chart_buffer:
+                await update.message.reply_photo(
+                    photo=chart_buffer,
+                    caption=caption_text,
+                    parse_mode="HTML"
+                )
+                return
             else:
-                logger.warning("No chart data available, falling back to text only")
-        except Exception as e:
-            logger.warning(f"Chart generation failed: {e}, falling back to text only")
+                logger.warning("Chart generation failed, falling back to text only")
+        else:
+            logger.warning("No chart data available, falling back to text only")
+    except Exception as e:
+        logger.warning(f"Chart generation failed: {e}, falling back to text only")
     
     # Fallback to text-only response if chart fails
     await update.message.reply_text(caption_text, parse_mode="HTML")
@@ -176,11 +176,11 @@ async def setleague_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     league_slug = context.args[0].strip()
 
     try:
-        async with make_session() as session:
-            rounds = await get_rounds(session, league_slug)
-            if not rounds:
-                await update.message.reply_text(f"❌ League <code>{league_slug}</code> not found or empty.")
-                return
+        session = await get_session()
+        rounds = await get_rounds(session, league_slug)
+        if not rounds:
+            await update.message.reply_text(f"❌ League <code>{league_slug}</code> not found or empty.")
+            return
     except Exception as e:
         await update.message.reply_text(f"❌ Could not access league <code>{league_slug}</code>: {e}")
         return
@@ -229,13 +229,13 @@ async def watch_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         del WATCHERS[chat_id]
 
     try:
-        async with make_session() as session:
-            rounds = await get_rounds(session, league)
-            if not rounds:
-                await update.message.reply_text(
-                    f"❌ No rounds found for league <code>{league}</code>.", parse_mode="HTML"
-                )
-                return
+        session = await get_session()
+        rounds = await get_rounds(session, league)
+        if not rounds:
+            await update.message.reply_text(
+                f"❌ No rounds found for league <code>{league}</code>.", parse_mode="HTML"
+            )
+            return
     except Exception as e:
         await update.message.reply_text(f"❌ Could not check league status: {e}")
         return
@@ -310,9 +310,9 @@ async def auth_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Usage: /auth <x-session-token>")
         return
 
-    from .http import CURRENT_TOKEN
+    from .http import set_session_token
     token = context.args[0].strip()
-    CURRENT_TOKEN["x_session_token"] = token
+    await set_session_token(token)
     await update.message.reply_text("✅ Token updated in memory. Try /scores again.")
 
 
@@ -409,45 +409,45 @@ async def _perform_lookup_and_reply(update: Update, league: str, search_term: st
     await ensure_champion_data_loaded()
     
     try:
-        async with make_session() as session:
-            result = await find_team_by_name_or_owner(session, league, search_term, mode)
-            if not result:
-                noun = "Team" if mode == "team" else "Owner"
-                await update.message.reply_text(
-                    f"❌ {noun} '<code>{search_term}</code>' not found in league '<code>{league}</code>'.",
-                    parse_mode="HTML",
-                )
-                return
-            team_info = result["team_info"]
-            base_round_obj = result["round_obj"]
-            team_id = team_info["userTeam"]["id"]
-
-            # Proactive previous-round selection during market_open before any roster fetch
-            use_round_obj = base_round_obj
-            proactive_note = ""
-            if base_round_obj.get("status") == "market_open":
-                try:
-                    rounds = await get_rounds(session, league)
-                    previous_round = pick_previous_round(rounds, base_round_obj)
-                    if previous_round:
-                        use_round_obj = previous_round
-                        proactive_note = "⚠️ <b>Mercado aberto</b>; mostrando roster da rodada anterior.\n\n"
-                except Exception:
-                    pass  # Fall back silently
+        session = await get_session()
+        result = await find_team_by_name_or_owner(session, league, search_term, mode)
+        if not result:
+            noun = "Team" if mode == "team" else "Owner"
+            await update.message.reply_text(
+                f"❌ {noun} '<code>{search_term}</code>' not found in league '<code>{league}</code>'.",
+                parse_mode="HTML",
+            )
+            return
+        team_info = result["team_info"]
+        base_round_obj = result["round_obj"]
+        team_id = team_info["userTeam"]["id"]
+
+        # Proactive previous-round selection during market_open before any roster fetch
+        use_round_obj = base_round_obj
+        proactive_note = ""
+        if base_round_obj.get("status") == "market_open":
+            try:
+                rounds = await get_rounds(session, league)
+                previous_round = pick_previous_round(rounds, base_round_obj)
+                if previous_round:
+                    use_round_obj = previous_round
+                    proactive_note = "⚠️ <b>Mercado aberto</b>; mostrando roster da rodada anterior.\n\n"
+            except Exception:
+                pass  # Fall back silently
 
-            round_id = use_round_obj["id"]
+        round_id = use_round_obj["id"]
 
-            try:
-                roster_data = await get_team_round_roster(session, round_id, team_id)
-                message = await fmt_team_details(team_info, use_round_obj, roster_data)
-                if proactive_note:
-                    message = proactive_note + message
-                await update.message.reply_text(message, parse_mode="HTML")
-            except PermissionError:
-                # As a safety net, attempt legacy fallback path
-                if await _handle_market_open_roster_fallback(session, league, search_term, mode, update):
-                    return
-                raise
+        try:
+            roster_data = await get_team_round_roster(session, round_id, team_id)
+            message = await fmt_team_details(team_info, use_round_obj, roster_data)
+            if proactive_note:
+                message = proactive_note + message
+            await update.message.reply_text(message, parse_mode="HTML")
+        except PermissionError:
+            # As a safety net, attempt legacy fallback path
+            if await _handle_market_open_roster_fallback(session, league, search_term, mode, update):
+                return
+            raise
     except PermissionError as e:
         await update.message.reply_text(f"🔐 {e}")
     except Exception as e:
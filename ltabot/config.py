@@ -1,31 +1,47 @@
 import os
+import asyncio
 import logging
 from functools import wraps
-from typing import Callable, Any
-from cachetools import TTLCache
+from typing import Awaitable, Callable, Any, Dict
+from cachetools import LRUCache, TTLCache
 
 
 def load_env() -> None:
     """Load environment variables from a .env file if available.
     Prefer python-dotenv when installed; otherwise, fall back to a simple reader.
     """
+    env_path = os.path.join(os.path.dirname(__file__), "..", ".env")
+    env_path = os.path.abspath(env_path)
+
     try:
         from dotenv import load_dotenv  # type: ignore
-        load_dotenv()
+        # Explicit path: skips dotenv's directory walk to find the file
+        load_dotenv(env_path)
         return
     except Exception:
         pass
 
-    env_path = os.path.join(os.path.dirname(__file__), "..", ".env")
-    env_path = os.path.abspath(env_path)
     if os.path.exists(env_path):
         try:
             with open(env_path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        os.environ.setdefault(key.strip(), value.strip())
+                for raw in f:
+                    line = raw.strip()
+                    if not line or line[0] == "#":
+                        continue
+                    key, sep, value = line.partition("=")
+                    if not sep:
+                        continue
+                    key = key.strip()
+                    # Variables already set by the shell/container win over .env
+                    if key in os.environ:
+                        continue
+                    value = value.strip()
+                    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                        value = value[1:-1]
+                    else:
+                        # Unquoted values may carry an inline comment, as in .env.example
+                        value = value.split(" #", 1)[0].rstrip()
+                    os.environ[key] = value
         except Exception:
             # Non-fatal
             pass
@@ -61,7 +77,7 @@ class Config:
 
     # Telegram Bot Configuration
     BOT_TOKEN: str | None = os.getenv("BOT_TOKEN")
-    ALLOWED_USER_ID: int = int(os.getenv("ALLOWED_USER_ID", "0"))
+    ALLOWED_USER_ID: int = int(os.getenv("ALLOWED_USER_ID", "0").strip() or "0")
 
     # LTA Fantasy API Configuration
     X_SESSION_TOKEN: str = os.getenv("X_SESSION_TOKEN", "").strip()
@@ -74,15 +90,33 @@ class Config:
     BACKOFF_MULTIPLIER: float = float(os.getenv("BACKOFF_MULTIPLIER", "2.0"))
     MAX_POLL_SECS: int = int(os.getenv("MAX_POLL_SECS", "900"))
 
+    # Rounds change rarely (status flips a few times per week), so they get a longer TTL
+    ROUNDS_CACHE_TTL: int = int(os.getenv("ROUNDS_CACHE_TTL", "60"))
+
+    # Per-team roster cache TTL; 0 follows the regular API cache TTL
+    ROSTER_CACHE_TTL: int = int(os.getenv("ROSTER_CACHE_TTL", "0"))
+
+    # Max in-flight per-team roster requests during a fan-out
+    ROSTER_CONCURRENCY: int = int(os.getenv("ROSTER_CONCURRENCY", "8"))
+
+    # Telegram webhook (empty WEBHOOK_URL keeps long polling)
+    WEBHOOK_URL: str = os.getenv("WEBHOOK_URL", "").strip()
+    WEBHOOK_PORT: int = int(os.getenv("WEBHOOK_PORT", "8443"))
+    WEBHOOK_SECRET: str = os.getenv("WEBHOOK_SECRET", "").strip()
+
     # API Endpoint Configuration
     LTA_API_URL: str = os.getenv("LTA_API_URL", "https://api.ltafantasy.com").strip()
 
     @classmethod
     def validate_config(cls) -> None:
-        if not cls.BOT_TOKEN:
-            raise ValueError("BOT_TOKEN environment variable is required")
-        if cls.ALLOWED_USER_ID == 0:
-            raise ValueError("ALLOWED_USER_ID environment variable is required")
+        # Report every missing variable at once rather than one per restart
+        missing = [
+            name
+            for name, value in (("BOT_TOKEN", cls.BOT_TOKEN), ("ALLOWED_USER_ID", cls.ALLOWED_USER_ID))
+            if not value
+        ]
+        if missing:
+            raise ValueError(f"Required environment variables not set: {', '.join(missing)}")
         if not cls.X_SESSION_TOKEN:
             logger.warning("X_SESSION_TOKEN not configured - use /auth to provide it")
 
@@ -105,6 +139,12 @@ POLL_SECS = config.POLL_SECS
 MAX_STALE_POLLS = config.MAX_STALE_POLLS
 BACKOFF_MULTIPLIER = config.BACKOFF_MULTIPLIER
 MAX_POLL_SECS = config.MAX_POLL_SECS
+ROUNDS_CACHE_TTL = config.ROUNDS_CACHE_TTL
+ROSTER_CACHE_TTL = config.ROSTER_CACHE_TTL
+ROSTER_CONCURRENCY = config.ROSTER_CONCURRENCY
+WEBHOOK_URL = config.WEBHOOK_URL
+WEBHOOK_PORT = config.WEBHOOK_PORT
+WEBHOOK_SECRET = config.WEBHOOK_SECRET
 
 # Legacy compatibility - removed phase-specific variables
 
@@ -112,14 +152,38 @@ MAX_POLL_SECS = config.MAX_POLL_SECS
 # Cache TTL is 80% of polling interval to ensure fresh data before next poll
 CACHE_TTL = max(int(POLL_SECS * 0.8), 5)  # Minimum 5 seconds
 api_cache = TTLCache(maxsize=200, ttl=CACHE_TTL)
+# Rounds list per league, kept longer than the per-poll cache
+rounds_cache = TTLCache(maxsize=50, ttl=max(ROUNDS_CACHE_TTL, 1))
+# Per-team rosters keyed by (round, team); sized for teams x rounds so split
+# recomputations don't evict rounds/ranking entries from api_cache
+roster_cache = TTLCache(maxsize=1000, ttl=ROSTER_CACHE_TTL or CACHE_TTL)
+# ETag/Last-Modified validators plus the parsed body per request, for conditional GETs
+conditional_cache = LRUCache(maxsize=200)
 
-def cached_api_call(cache_key_func: Callable[..., str]):
+
+def clear_api_caches() -> None:
+    """Drop all cached API responses (e.g. after the session token changes)."""
+    api_cache.clear()
+    rounds_cache.clear()
+    roster_cache.clear()
+    conditional_cache.clear()
+
+
+def cached_api_call(cache_key_func: Callable[..., str], cache: TTLCache | None = None):
     """
     Decorator for caching API calls with TTL based on polling interval.
+
+    Concurrent misses for the same key share one in-flight request, so chats
+    watching the same league trigger one API call per poll window instead of
+    one per chat.
     
     Args:
         cache_key_func: Function that generates cache key from function arguments
+        cache: TTL cache to store results in (defaults to api_cache)
     """
+    target_cache = api_cache if cache is None else cache
+    inflight: Dict[str, asyncio.Task] = {}
+
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -127,17 +191,40 @@ def cached_api_call(cache_key_func: Callable[..., str]):
             key = cache_key_func(*args, **kwargs)
             
             # Check cache first
-            if key in api_cache:
-                logger.debug(f"Cache hit for: {key}")
-                return api_cache[key]
-            
-            # Call original function
-            logger.debug(f"Cache miss, calling API for: {key}")
-            result = await func(*args, **kwargs)
-            
-            # Store in cache
-            api_cache[key] = result
-            logger.debug(f"Cached result for: {key}")
-            return result
+            if key in target_cache:
+                logger.debug("Cache hit for: %s", key)
+                return target_cache[key]
+
+            async def load():
+                # Call original function
+                logger.debug("Cache miss, calling API for: %s", key)
+                result = await func(*args, **kwargs)
+                # Store in cache
+                target_cache[key] = result
+                logger.debug("Cached result for: %s", key)
+                return result
+
+            return await single_flight(inflight, key, load)
         return wrapper
     return decorator
+
+
+async def single_flight(inflight: Dict[str, asyncio.Task], key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run factory() once per key; concurrent callers await the same in-flight task."""
+    task = inflight.get(key)
+    if task is not None:
+        logger.debug("Joining in-flight call for: %s", key)
+    else:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+        task.add_done_callback(lambda t: _finish_inflight(inflight, key, t))
+    # Shielded so one caller being cancelled doesn't fail the others
+    return await asyncio.shield(task)
+
+
+def _finish_inflight(inflight: Dict[str, asyncio.Task], key: str, task: asyncio.Task) -> None:
+    if inflight.get(key) is task:
+        del inflight[key]
+    # Mark the exception as retrieved in case every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
@@ -1,10 +1,74 @@
 from __future__ import annotations
 
 import hashlib
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 
+_MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+
+def _medal(n: int) -> str:
+    return _MEDALS.get(n) or f"{n:>2}."
+
+
+# Roster display order; unknown roles sort last
+_ROLE_ORDER = {"top": 0, "jungle": 1, "mid": 2, "bottom": 3, "support": 4}
+_ROLE_EMOJIS = {"top": "⚔️", "jungle": "🌿", "mid": "🔮", "bottom": "🏹", "support": "🛡️"}
+
+# Short labels for score detail types (API spelling, "asssits" included)
+_DETAIL_NAMES = {
+    "kills": "K",
+    "asssits": "A",
+    "deaths": "D",
+    "cs": "CS",
+    "gold_advantage_at_14": "Gold@14",
+    "kp_70": "KP>70%",
+    "damage_share_30": "DMG>30%",
+    "victory": "Victory",
+    "underdog_victory": "Underdog Win",
+    "stomp": "Stomp",
+    "perfect_scores": "Perfect Game",
+    "triple_kills": "Triple Kill",
+    "over_ten_kills": "10+ Kills",
+    "jng_barons": "Baron",
+    "jng_dragon_soul": "Dragon Soul",
+    "jng_kp_over_75": "KP>75%",
+    "sup_kp_over_75": "KP>75%",
+    "sup_vision_score": "Vision",
+    "top_damage_share": "DMG Share",
+    "top_tank": "Tank",
+    "top_solo_kills": "Solo Kill",
+}
+
+
+# Resolved once at import rather than on every standings render
+try:
+    # zoneinfo gives proper DST handling
+    from zoneinfo import ZoneInfo
+    _BRT_TZ = ZoneInfo("America/Sao_Paulo")
+except Exception:
+    # Fallback to fixed UTC-3 if zoneinfo/tzdata is not available
+    _BRT_TZ = timezone(timedelta(hours=-3))
+
+
+# Separates the "updated at" footer from the standings body in fmt_standings output
+TIMESTAMP_SEPARATOR = "\n\n🕒 "
+
+
+def strip_timestamp(message: str) -> str:
+    """Return the message without its "updated at" line, keeping any status lines after it."""
+    head, sep, tail = message.rpartition(TIMESTAMP_SEPARATOR)
+    if not sep:
+        return message
+    _, newline, rest = tail.partition("\n")
+    return head + newline + rest
+
+
+@lru_cache(maxsize=4096)
 def _escape_html(text: str) -> str:
+    # Team, owner and player names repeat on every poll, so memoize the escapes
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
@@ -16,23 +80,15 @@ def fmt_standings(
     include_timestamp: bool = False,
     score_type: str = "Round",
 ) -> str:
-    title = (
-        f"🏆 <b>{_escape_html(league_slug)}</b>\n"
-        f"🧭 <b>{_escape_html(round_obj.get('name', ''))}</b> ({_escape_html(round_obj.get('status', ''))})\n"
-        f"📊 <i>{score_type} Scores</i>"
-    )
-
-    def medal(n: int) -> str:
-        if n == 1:
-            return "🥇"
-        elif n == 2:
-            return "🥈"
-        elif n == 3:
-            return "🥉"
-        else:
-            return f"{n:>2}."
-
-    lines: List[str] = []
+    # Collect every line and join once instead of concatenating the message piecewise
+    parts: List[str] = [
+        f"🏆 <b>{_escape_html(league_slug)}</b>",
+        f"🧭 <b>{_escape_html(round_obj.get('name', ''))}</b> ({_escape_html(round_obj.get('status', ''))})",
+        f"📊 <i>{score_type} Scores</i>",
+        "",
+    ]
+
+    changes = score_changes or {}
     for row in rows:
         if len(row) == 5:  # New format with no_roster flag
             r, t, o, p, no_roster = row
@@ -41,58 +97,33 @@ def fmt_standings(
             r, t, o, p = row
             no_roster_flag = ""
         
-        arrow = (score_changes or {}).get(t, "")
+        arrow = changes.get(t, "")
         safe_team = _escape_html(t)
         safe_owner = _escape_html(o)
-        lines.append(f"{medal(r)} <b>{safe_team}</b> — {safe_owner} · <code>{p:.2f}</code> {arrow} {no_roster_flag}")
+        parts.append(f"{_medal(r)} <b>{safe_team}</b> — {safe_owner} · <code>{p:.2f}</code> {arrow} {no_roster_flag}")
 
-    message = f"{title}\n\n" + ("\n".join(lines) if lines else "<i>No teams</i>")
+    if not rows:
+        parts.append("<i>No teams</i>")
 
     if include_timestamp:
-        from .formatting import format_brt_time
-        from datetime import datetime, timezone
         # Always use UTC for base time, then convert to BRT
-        current_utc = datetime.now(timezone.utc).isoformat()
-        brt_time = format_brt_time(current_utc)
-        message += f"\n\n🕒 <i>Atualizado às {brt_time}</i>"
+        brt_time = _format_brt(datetime.now(timezone.utc))
+        # Kept as a separable footer so dedup can ignore it (see strip_timestamp)
+        parts[-1] += f"{TIMESTAMP_SEPARATOR}<i>Atualizado às {brt_time}</i>"
 
-    return message
+    return "\n".join(parts)
 
 
 def format_score_details(details: List[Dict[str, Any]]) -> str:
     lines: List[str] = []
 
-    detail_names = {
-        "kills": "K",
-        "asssits": "A",
-        "deaths": "D",
-        "cs": "CS",
-        "gold_advantage_at_14": "Gold@14",
-        "kp_70": "KP>70%",
-        "damage_share_30": "DMG>30%",
-        "victory": "Victory",
-        "underdog_victory": "Underdog Win",
-        "stomp": "Stomp",
-        "perfect_scores": "Perfect Game",
-        "triple_kills": "Triple Kill",
-        "over_ten_kills": "10+ Kills",
-        "jng_barons": "Baron",
-        "jng_dragon_soul": "Dragon Soul",
-        "jng_kp_over_75": "KP>75%",
-        "sup_kp_over_75": "KP>75%",
-        "sup_vision_score": "Vision",
-        "top_damage_share": "DMG Share",
-        "top_tank": "Tank",
-        "top_solo_kills": "Solo Kill",
-    }
-
     for detail in details:
         detail_type = detail.get("detailType", "")
         count = detail.get("count", 0)
         value = detail.get("value", 0)
         display_mode = detail.get("displayMode", "")
 
-        name = detail_names.get(detail_type, detail_type)
+        name = _DETAIL_NAMES.get(detail_type, detail_type)
 
         if display_mode == "percent":
             lines.append(f"• {name}: {count:.0%} (+{value})")
@@ -117,36 +148,26 @@ async def fmt_team_details(team_info: Dict[str, Any], round_obj: Dict[str, Any],
     points_partial = round_roster.get("pointsPartial", 0) or 0
     pre_budget = round_roster.get("preRoundBudget", 0)
 
-    def get_rank_medal(r: int) -> str:
-        if r == 1:
-            return "🥇"
-        elif r == 2:
-            return "🥈"
-        elif r == 3:
-            return "🥉"
-        else:
-            return f"#{r}"
-
-    rank_display = get_rank_medal(rank if isinstance(rank, int) else 0)
+    rank_display = _MEDALS.get(rank) or f"#{rank if isinstance(rank, int) else 0}"
 
-    message = f"🏆 <b>{team_name}</b>\n"
-    message += f"👤 <b>{owner_name}</b> • {rank_display}\n"
-    message += f"📊 <b>{points_partial:.2f}</b> pontos • 💰 {pre_budget:.1f}M budget\n\n"
-    message += f"🧭 <b>{_escape_html(round_obj.get('name', ''))}</b> ({_escape_html(round_obj.get('status', ''))})\n\n"
+    parts = [
+        f"🏆 <b>{team_name}</b>\n",
+        f"👤 <b>{owner_name}</b> • {rank_display}\n",
+        f"📊 <b>{points_partial:.2f}</b> pontos • 💰 {pre_budget:.1f}M budget\n\n",
+        f"🧭 <b>{_escape_html(round_obj.get('name', ''))}</b> ({_escape_html(round_obj.get('status', ''))})\n\n",
+    ]
 
     roster_players = roster_data.get("rosterPlayers", [])
     if not roster_players:
-        message += "<i>No roster data available</i>"
-        return message
+        parts.append("<i>No roster data available</i>")
+        return "".join(parts)
 
-    role_emojis = {"top": "⚔️", "jungle": "🌿", "mid": "🔮", "bottom": "🏹", "support": "🛡️"}
-    role_order = ["top", "jungle", "mid", "bottom", "support"]
-    roster_players.sort(key=lambda p: role_order.index(p.get("role", "support")) if p.get("role") in role_order else 999)
+    roster_players.sort(key=lambda p: _ROLE_ORDER.get(p.get("role"), 999))
 
     for player in roster_players:
-        message += await format_player_section(player, role_emojis)
+        parts.append(await format_player_section(player, _ROLE_EMOJIS))
 
-    return message.strip()
+    return "".join(parts).strip()
 
 
 async def format_player_section(player: Dict[str, Any], role_emojis: Dict[str, str]) -> str:
@@ -183,25 +204,25 @@ async def format_player_section(player: Dict[str, Any], role_emojis: Dict[str, s
         else:
             pick_status_line = f"☑️ {owner_champion_name}\n"
 
-    section = f"{role_emoji} <b>{player_name}</b> ({team_name_short})\n"
+    parts = [f"{role_emoji} <b>{player_name}</b> ({team_name_short})\n"]
     if pick_status_line:
-        section += pick_status_line
-    section += f"💰 {price}M • 📊 <b>{player_points:.2f}</b> pts\n"
+        parts.append(pick_status_line)
+    parts.append(f"💰 {price}M • 📊 <b>{player_points:.2f}</b> pts\n")
 
     games = player.get("games", [])
     if games:
         games_text = await format_games_details(games)
         if games_text:
-            section += f"<blockquote expandable>{games_text.strip()}</blockquote>\n"
+            parts.append(f"<blockquote expandable>{games_text.strip()}</blockquote>\n")
     else:
-        section += "<i>No games played yet</i>\n"
+        parts.append("<i>No games played yet</i>\n")
 
-    section += "\n"
-    return section
+    parts.append("\n")
+    return "".join(parts)
 
 
 async def format_games_details(games: List[Dict[str, Any]]) -> str:
-    games_text = ""
+    parts: List[str] = []
     for i, game in enumerate(games, 1):
         opponent = game.get("opponentTeam", {})
         opponent_name = _escape_html(opponent.get("name", "Unknown"))
@@ -217,53 +238,58 @@ async def format_games_details(games: List[Dict[str, Any]]) -> str:
             champion_name = await get_champion_name(champion_id)
             champion_info = f" ({champion_name})"
         
-        games_text += f"<b>Game {i}</b> vs {opponent_name}: <b>{game_points:.2f}</b>{multiplier_text}{champion_info}\n"
+        parts.append(f"<b>Game {i}</b> vs {opponent_name}: <b>{game_points:.2f}</b>{multiplier_text}{champion_info}\n")
 
         details = game.get("details", [])
         if details:
-            games_text += format_score_details(details) + "\n"
-        games_text += "\n"
+            parts.append(format_score_details(details) + "\n")
+        parts.append("\n")
 
-    return games_text
+    return "".join(parts)
 
 
 def hash_payload(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    # Change detection only, no security requirement: BLAKE2b-128 is cheaper than SHA-256
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def format_brt_time(utc_time_str: str) -> str:
     """Convert UTC time string to BRT time string using America/Sao_Paulo timezone."""
     try:
-        from datetime import datetime, timezone, timedelta
-        
-        # Try to use zoneinfo for proper DST handling
-        try:
-            from zoneinfo import ZoneInfo
-            # Parse UTC time
-            utc_time = datetime.fromisoformat(utc_time_str.replace("Z", "+00:00"))
-            
-            # Convert to America/Sao_Paulo timezone (handles DST automatically)
-            sao_paulo_tz = ZoneInfo("America/Sao_Paulo")
-            brt_time = utc_time.astimezone(sao_paulo_tz)
-            
-            return brt_time.strftime("%Y-%m-%d %H:%M BRT")
-        except ImportError:
-            # Fallback to fixed UTC-3 if zoneinfo is not available
-            pass
-        
-        # Parse UTC time
-        utc_time = datetime.fromisoformat(utc_time_str.replace("Z", "+00:00"))
-        
-        # Convert to BRT (UTC-3)
-        brt_offset = timedelta(hours=-3)
-        brt_tz = timezone(brt_offset)
-        brt_time = utc_time.astimezone(brt_tz)
-        
-        return brt_time.strftime("%Y-%m-%d %H:%M BRT")
+        return _format_brt(datetime.fromisoformat(utc_time_str.replace("Z", "+00:00")))
     except Exception:
         return utc_time_str  # Fallback to original
 
 
+def _format_brt(utc_time: datetime) -> str:
+    """Format an aware datetime as BRT, without a string round-trip."""
+    return utc_time.astimezone(_BRT_TZ).strftime("%Y-%m-%d %H:%M BRT")
+
+
+def _format_budget_delta(pre: float, post: float) -> str:
+    delta = post - pre
+    if delta == 0:
+        return ""
+    sign = "+" if delta > 0 else ""
+    return f"({sign}{delta:.1f})"
+
+
+def _price_change_emoji(price_delta: float) -> str:
+    if price_delta > 0:
+        return "📈"
+    if price_delta < 0:
+        return "📉"
+    return "🟰"
+
+
+def _format_player_change(role: str, player_name: str, pre_price: float, post_price: float) -> str:
+    price_delta = post_price - pre_price
+    if price_delta == 0:
+        return f"{_escape_html(player_name)}: 0.0"
+    sign = "+" if price_delta > 0 else ""
+    return f"{_price_change_emoji(price_delta)} {_escape_html(player_name)}: {sign}{price_delta:.1f}"
+
+
 def _build_team_section(
     team_name: str,
     owner_name: str,
@@ -273,45 +299,16 @@ def _build_team_section(
 ) -> str:
     """Build individual team section for market open notification."""
 
-    def format_budget_delta(pre: float, post: float) -> str:
-        delta = post - pre
-        if delta == 0:
-            return ""
-        sign = "+" if delta > 0 else ""
-        return f"({sign}{delta:.1f})"
-
-    def format_player_change(role: str, player_name: str, pre_price: float, post_price: float) -> str:
-        price_delta = post_price - pre_price
-        if price_delta == 0:
-            return f"{_escape_html(player_name)}: 0.0"
-        sign = "+" if price_delta > 0 else ""
-        emoji = get_price_change_emoji(price_delta)
-        return f"{emoji} {_escape_html(player_name)}: {sign}{price_delta:.1f}"
-
-    def get_price_change_emoji(price_delta):
-        if price_delta > 0:
-            emoji = "📈"
-        elif price_delta < 0:
-            emoji = "📉"
-        else:
-            emoji = "🟰"
-        return emoji
-
-    budget_delta_text = format_budget_delta(pre_budget, post_budget)
+    budget_delta_text = _format_budget_delta(pre_budget, post_budget)
     section = (
-        f"{get_price_change_emoji(post_budget - pre_budget)} <b>{_escape_html(team_name)}</b> ({_escape_html(owner_name)}): "
+        f"{_price_change_emoji(post_budget - pre_budget)} <b>{_escape_html(team_name)}</b> ({_escape_html(owner_name)}): "
         f"{pre_budget:.1f} → {post_budget:.1f} {budget_delta_text}"
     )
 
-    role_order = ["top", "jungle", "mid", "bottom", "support"]
-
     if player_changes:
-        sorted_player_changes = sorted(
-            player_changes,
-            key=lambda p: role_order.index(p[0]) if p[0] in role_order else 999,
-        )
+        sorted_player_changes = sorted(player_changes, key=lambda p: _ROLE_ORDER.get(p[0], 999))
         player_details = [
-            format_player_change(role, player_name, pre_price, post_price)
+            _format_player_change(role, player_name, pre_price, post_price)
             for role, player_name, pre_price, post_price in sorted_player_changes
         ]
         if player_details:
@@ -329,21 +326,11 @@ def fmt_manual_split_ranking(league_slug: str, completed_round: Dict[str, Any],
         f"📊 <b>Split (acumulado)</b> após {_escape_html(completed_round.get('name', ''))}\n"
     )
 
-    def medal(n: int) -> str:
-        if n == 1:
-            return "🥇"
-        elif n == 2:
-            return "🥈"
-        elif n == 3:
-            return "🥉"
-        else:
-            return f"{n:>2}."
-
     lines: List[str] = []
     for i, (team_name, owner_name, total_score) in enumerate(split_totals, 1):
         safe_team = _escape_html(team_name)
         safe_owner = _escape_html(owner_name)
-        lines.append(f"{medal(i)} <b>{safe_team}</b> — {safe_owner} · <code>{total_score:.2f}</code>")
+        lines.append(f"{_medal(i)} <b>{safe_team}</b> — {safe_owner} · <code>{total_score:.2f}</code>")
 
     message = f"{title}\n\n" + ("\n".join(lines) if lines else "<i>No teams</i>")
     return message
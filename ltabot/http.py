@@ -1,29 +1,57 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import aiohttp
 from typing import Any, Dict
-from .config import X_SESSION_TOKEN, logger
+from .config import X_SESSION_TOKEN, POLL_SECS, ROSTER_CONCURRENCY, clear_api_caches, conditional_cache, logger
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    # Fall back to stdlib json when orjson isn't installed
+    json_loads = json.loads
 
-CURRENT_TOKEN: Dict[str, str] = {"x_session_token": X_SESSION_TOKEN}
+
+# Session token sent with every API request; replaced at runtime by /auth
+_TOKEN: str = X_SESSION_TOKEN
+_TOKEN_LOCK = asyncio.Lock()
+
+# Shared API session (created lazily on first use, closed on shutdown)
+_SESSION: aiohttp.ClientSession | None = None
+
+
+# Static headers, applied once to the shared session; only the token varies per request
+_BASE_HEADERS: Dict[str, str] = {
+    "accept": "*/*",
+    "accept-language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+    # Bruno's UA works around Cloudflare
+    "user-agent": "bruno-runtime/2.9.0",
+    "origin": "https://ltafantasy.com",
+    "referer": "https://ltafantasy.com/",
+    "pragma": "no-cache",
+    "cache-control": "no-cache",
+    "dnt": "1",
+}
+
+
+def build_token_headers() -> Dict[str, str] | None:
+    token = _TOKEN
+    return {"x-session-token": token} if token else None
+
+
+async def set_session_token(token: str) -> None:
+    """Swap the API session token and drop responses cached under the old one."""
+    global _TOKEN
+    async with _TOKEN_LOCK:
+        _TOKEN = token
+        # Responses fetched with the old token may be stale or incomplete
+        clear_api_caches()
 
 
 def build_headers() -> Dict[str, str]:
-    token = CURRENT_TOKEN.get("x_session_token") or ""
-    h = {
-        "accept": "*/*",
-        "accept-language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
-        # Bruno's UA works around Cloudflare
-        "user-agent": "bruno-runtime/2.9.0",
-        "origin": "https://ltafantasy.com",
-        "referer": "https://ltafantasy.com/",
-        "pragma": "no-cache",
-        "cache-control": "no-cache",
-        "dnt": "1",
-    }
-    if token:
-        h["x-session-token"] = token
-    return h
+    return _BASE_HEADERS | (build_token_headers() or {})
 
 
 def make_session() -> aiohttp.ClientSession:
@@ -35,9 +63,72 @@ def make_session() -> aiohttp.ClientSession:
     )
 
 
-async def fetch_json(session: aiohttp.ClientSession, url: str, params: Dict[str, str] | None = None) -> Any:
-    logger.debug(f"API request: {url}")
-    async with session.get(url, params=params) as r:
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared API session, creating it on first use.
+
+    The session keeps a pooled connector so polls reuse keep-alive connections
+    instead of paying a TCP+TLS handshake per call. The session token is not
+    baked into the session headers; fetch_json sends it per request so /auth
+    rotation takes effect without rebuilding the pool.
+    """
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            # Keep enough keep-alive connections for a full roster fan-out
+            limit_per_host=max(20, ROSTER_CONCURRENCY),
+            # Outlive the poll interval so idle connections survive between polls
+            keepalive_timeout=max(60, POLL_SECS * 2),
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        _SESSION = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=25),
+            headers=_BASE_HEADERS,
+            connector=connector,
+            trust_env=True,
+        )
+        logger.debug("Created shared API session")
+    return _SESSION
+
+
+async def close_session() -> None:
+    """Close the shared API session (called on bot shutdown)."""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+        logger.debug("Closed shared API session")
+    _SESSION = None
+
+
+async def fetch_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: Dict[str, str] | None = None,
+    conditional: bool = False,
+) -> Any:
+    """GET a JSON endpoint.
+
+    With conditional=True, the ETag/Last-Modified from the previous response is
+    sent back and a 304 reuses the previously parsed body, skipping the
+    download and parse.
+    """
+    logger.debug("API request: %s", url)
+    headers = build_token_headers()
+    cache_key = (url, tuple(sorted(params.items())) if params else ())
+    cached = conditional_cache.get(cache_key) if conditional else None
+    if cached is not None:
+        etag, last_modified, _ = cached
+        headers = dict(headers or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    async with session.get(url, params=params, headers=headers) as r:
+        if r.status == 304 and cached is not None:
+            logger.debug("API not modified: %s", url)
+            return cached[2]
         if r.status in (401, 403):
             txt = await r.text()
             error_msg = f"Auth failed ({r.status}). Update token with /auth <token>. Body: {txt[:180]}"
@@ -48,5 +139,12 @@ async def fetch_json(session: aiohttp.ClientSession, url: str, params: Dict[str,
             error_msg = f"HTTP {r.status} for {url} :: {txt[:300]}"
             logger.error(f"API error for {url}: {r.status}")
             raise RuntimeError(error_msg)
-        logger.debug(f"API success: {url}")
-        return await r.json()
+        logger.debug("API success: %s", url)
+        # Parse the raw bytes directly; orjson skips the intermediate str decode
+        data = json_loads(await r.read())
+        if conditional:
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
+            if etag or last_modified:
+                conditional_cache[cache_key] = (etag, last_modified, data)
+        return data
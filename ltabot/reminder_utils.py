@@ -105,7 +105,7 @@ def mark_reminder_sent(reminder_schedule: Dict[str, Any], reminder_type: str) ->
     flag_key = f"{reminder_type}_sent" if reminder_type != "closed_transition" else "closed_transition_triggered"
     reminder_schedule["flags"][flag_key] = True
     
-    logger.debug(f"Marked {reminder_type} as sent for round {reminder_schedule.get('round_id', 'unknown')}")
+    logger.debug("Marked %s as sent for round %s", reminder_type, reminder_schedule.get('round_id', 'unknown'))
 
 
 def get_next_reminder_time(reminder_schedule: Dict[str, Any]) -> Optional[datetime]:
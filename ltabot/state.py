@@ -14,7 +14,8 @@ class WatcherPhase(Enum):
 
 # Runtime state stores (module-level singletons)
 WATCHERS: Dict[int, asyncio.Task] = {}
-LAST_SENT_HASH: Dict[int, str] = {}
+LAST_SENT_HASH: Dict[int, str] = {}  # Persisted digests, only consulted until a chat sends again
+LAST_SENT_TEXT: Dict[int, str] = {}  # Last message body minus timestamp footer, compared directly for dedup
 WATCH_MESSAGE_IDS: Dict[int, int] = {}
 LAST_SCORES: Dict[int, Dict[str, float]] = {}
 LAST_RANKINGS: Dict[int, List[str]] = {}
@@ -33,13 +34,38 @@ CURRENT_BACKOFF: Dict[int, float] = {}
 LAST_SCORE_CHANGE_AT: Dict[int, str] = {}
 IS_STALE: Dict[int, bool] = {}
 NO_CHANGE_POLLS: Dict[int, int] = {}
+ERROR_STREAKS: Dict[int, Tuple[str, int]] = {}  # Last watch error text and consecutive repeat count
 
 # Phase change events to wake up main loops from scheduled tasks
 PHASE_CHANGE_EVENTS: Dict[int, asyncio.Event] = {}
 
+# Per-chat stores dropped together when a watch session ends. WATCHERS and
+# SCHEDULED_TASKS are handled separately since their tasks need cancelling.
+CHAT_STATE_STORES: Tuple[Dict[int, Any], ...] = (
+    LAST_SCORES,
+    LAST_RANKINGS,
+    LAST_SPLIT_RANKINGS,
+    LAST_PARTIAL_RANKINGS,
+    CACHED_PARTIAL_RANKINGS,
+    WATCH_MESSAGE_IDS,
+    LAST_SENT_HASH,
+    LAST_SENT_TEXT,
+    FIRST_POLL_AFTER_RESUME,
+    WATCHER_PHASES,
+    STALE_COUNTERS,
+    CURRENT_BACKOFF,
+    REMINDER_SCHEDULES,
+    PHASE_CHANGE_EVENTS,
+    LAST_SCORE_CHANGE_AT,
+    IS_STALE,
+    NO_CHANGE_POLLS,
+    ERROR_STREAKS,
+)
+
 # Persistent files
 GROUP_SETTINGS_FILE = "group_settings.json"
 RUNTIME_STATE_FILE = "runtime_state.json"
+COMMANDS_HASH_FILE = "commands_hash.txt"
 
 # In-memory
 GROUP_SETTINGS: Dict[str, Dict[str, Any]] = {}
@@ -1,27 +1,50 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .config import logger
+from .formatting import hash_payload
 from .state import (
     GROUP_SETTINGS,
     GROUP_SETTINGS_FILE,
     RUNTIME_STATE_FILE,
+    COMMANDS_HASH_FILE,
     WatcherPhase,
 )
 from .state import LAST_SCORE_CHANGE_AT, IS_STALE
 
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    # Fall back to stdlib json when orjson isn't installed
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
 
 def load_group_settings() -> None:
     """Load group settings from JSON file."""
     global GROUP_SETTINGS
     try:
         if os.path.exists(GROUP_SETTINGS_FILE):
-            with open(GROUP_SETTINGS_FILE, "r") as f:
-                GROUP_SETTINGS = json.load(f)
+            with open(GROUP_SETTINGS_FILE, "rb") as f:
+                GROUP_SETTINGS = _json_loads(f.read())
             logger.info(f"Loaded settings for {len(GROUP_SETTINGS)} groups")
         else:
             logger.info("No existing group settings file found")
@@ -30,79 +53,104 @@ def load_group_settings() -> None:
         GROUP_SETTINGS = {}
 
 
+def _atomic_write(path: str, payload: bytes) -> None:
+    """Write to a temp file and swap it in so a crash never leaves a truncated file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+# One writer thread keeps disk I/O off the event loop and applies writes in submission order
+_STATE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-writer")
+
+
+def _write_off_loop(write: Callable[..., None], *args: Any) -> None:
+    """Run a file write on the writer thread when an event loop is running, inline otherwise."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        write(*args)
+        return
+    loop.run_in_executor(_STATE_WRITER, write, *args)
+
+
 def save_group_settings() -> None:
     try:
-        with open(GROUP_SETTINGS_FILE, "w") as f:
-            json.dump(GROUP_SETTINGS, f, indent=2)
+        # Snapshot on the caller's thread; only the write moves off the loop
+        _write_off_loop(_write_group_settings_file, _json_dumps(GROUP_SETTINGS, indent=True))
+    except Exception as e:
+        logger.error(f"Could not save group settings: {e}")
+
+
+def _write_group_settings_file(payload: bytes) -> None:
+    try:
+        _atomic_write(GROUP_SETTINGS_FILE, payload)
         logger.debug("Group settings saved to file")
     except Exception as e:
         logger.error(f"Could not save group settings: {e}")
 
 
+def _restore_chat_keyed(store: Dict[int, Any], data: Dict[str, Any]) -> None:
+    """Replace a chat-keyed store in place with persisted data, converting keys back to int."""
+    store.clear()
+    store.update(zip(map(int, data), data.values()))
+
+
+# Active chats captured by load_runtime_state, so resuming doesn't parse the file again
+_LOADED_ACTIVE_CHATS: Optional[List[int]] = None
+
+
 def load_runtime_state() -> None:
+    global _LOADED_ACTIVE_CHATS
     try:
         if os.path.exists(RUNTIME_STATE_FILE):
-            with open(RUNTIME_STATE_FILE, "r") as f:
-                state = json.load(f)
+            with open(RUNTIME_STATE_FILE, "rb") as f:
+                state = _json_loads(f.read())
+            _LOADED_ACTIVE_CHATS = [int(chat_id) for chat_id in state.get("active_chats", [])]
             
             # Use function-level imports to avoid module isolation issues
             from .watchers import (
                 LAST_SCORES, LAST_RANKINGS, LAST_SPLIT_RANKINGS, WATCH_MESSAGE_IDS,
                 WATCHER_PHASES, REMINDER_SCHEDULES, STALE_COUNTERS, CURRENT_BACKOFF, WatcherPhase
             )
-            from .state import LAST_SCORE_CHANGE_AT, IS_STALE, NO_CHANGE_POLLS, LAST_PARTIAL_RANKINGS, COMPLETED_ROUND_CACHE
-            
-            # Clear and update the actual state variables
-            LAST_SCORES.clear()
-            LAST_SCORES.update({int(k): v for k, v in state.get("last_scores", {}).items()})
-            
-            LAST_RANKINGS.clear()
-            LAST_RANKINGS.update({int(k): v for k, v in state.get("last_rankings", {}).items()})
+            from .state import LAST_SCORE_CHANGE_AT, IS_STALE, NO_CHANGE_POLLS, LAST_PARTIAL_RANKINGS, COMPLETED_ROUND_CACHE, LAST_SENT_HASH
             
-            LAST_SPLIT_RANKINGS.clear()
-            LAST_SPLIT_RANKINGS.update({int(k): v for k, v in state.get("last_split_rankings", {}).items()})
-            
-            LAST_PARTIAL_RANKINGS.clear()
-            LAST_PARTIAL_RANKINGS.update({int(k): v for k, v in state.get("last_partial_rankings", {}).items()})
-            
-            WATCH_MESSAGE_IDS.clear()
-            WATCH_MESSAGE_IDS.update({int(k): v for k, v in state.get("watch_message_ids", {}).items()})
+            # Clear and update the actual state variables (JSON object keys are strings)
+            for key, store in (
+                ("last_scores", LAST_SCORES),
+                ("last_rankings", LAST_RANKINGS),
+                ("last_split_rankings", LAST_SPLIT_RANKINGS),
+                ("last_partial_rankings", LAST_PARTIAL_RANKINGS),
+                ("watch_message_ids", WATCH_MESSAGE_IDS),
+                ("reminder_schedules", REMINDER_SCHEDULES),
+                ("stale_counters", STALE_COUNTERS),
+                ("current_backoff", CURRENT_BACKOFF),
+                ("last_score_change_at", LAST_SCORE_CHANGE_AT),
+                ("is_stale", IS_STALE),
+                ("no_change_polls", NO_CHANGE_POLLS),
+                # Restored so a restart doesn't re-send unchanged standings to every chat
+                ("last_sent_hash", LAST_SENT_HASH),
+            ):
+                _restore_chat_keyed(store, state.get(key, {}))
             
             # Load phase-based state
             phases_data = state.get("watcher_phases", {})
             WATCHER_PHASES.clear()
             WATCHER_PHASES.update({int(k): WatcherPhase(v) for k, v in phases_data.items()})
             
-            REMINDER_SCHEDULES.clear()
-            REMINDER_SCHEDULES.update({int(k): v for k, v in state.get("reminder_schedules", {}).items()})
-            
-            STALE_COUNTERS.clear()
-            STALE_COUNTERS.update({int(k): v for k, v in state.get("stale_counters", {}).items()})
-            
-            CURRENT_BACKOFF.clear()
-            CURRENT_BACKOFF.update({int(k): v for k, v in state.get("current_backoff", {}).items()})
-            
-            LAST_SCORE_CHANGE_AT.clear()
-            LAST_SCORE_CHANGE_AT.update({int(k): v for k, v in state.get("last_score_change_at", {}).items()})
-
-            IS_STALE.clear()
-            IS_STALE.update({int(k): v for k, v in state.get("is_stale", {}).items()})
-
-            NO_CHANGE_POLLS.clear()
-            NO_CHANGE_POLLS.update({int(k): v for k, v in state.get("no_change_polls", {}).items()})
-            
             COMPLETED_ROUND_CACHE.clear()
             COMPLETED_ROUND_CACHE.update(state.get("completed_round_cache", {}))
 
-            active_chats_count = len(state.get("active_chats", []))
-            logger.info(f"Loaded runtime state for {active_chats_count} chats")
-            logger.debug(f"Loaded WATCHER_PHASES: {WATCHER_PHASES}")
-            logger.debug(f"Loaded REMINDER_SCHEDULES: {REMINDER_SCHEDULES}")
+            logger.info(f"Loaded runtime state for {len(_LOADED_ACTIVE_CHATS)} chats")
+            logger.debug("Loaded WATCHER_PHASES: %s", WATCHER_PHASES)
+            logger.debug("Loaded REMINDER_SCHEDULES: %s", REMINDER_SCHEDULES)
         else:
+            _LOADED_ACTIVE_CHATS = []
             logger.info("No existing runtime state file found")
     except Exception as e:
         logger.error(f"Could not load runtime state: {e}")
-        logger.debug(f"Load error details: {type(e).__name__}: {str(e)}")
+        logger.debug("Load error details: %s: %s", type(e).__name__, e)
 
 
 def save_runtime_state() -> None:
@@ -114,30 +162,65 @@ def save_runtime_state() -> None:
         )
         from .state import LAST_SCORE_CHANGE_AT, IS_STALE, NO_CHANGE_POLLS, LAST_PARTIAL_RANKINGS, COMPLETED_ROUND_CACHE
         
-        # WATCHERS list is maintained in watchers module; defer active_chats collection there
+        # WATCHERS list is maintained in watchers module; defer active_chats collection there.
+        # Chat-id keyed dicts go in as-is: both serializers write int keys as strings
         state = {
-            "last_scores": {str(k): v for k, v in LAST_SCORES.items()},
-            "last_rankings": {str(k): v for k, v in LAST_RANKINGS.items()},
-            "last_split_rankings": {str(k): v for k, v in LAST_SPLIT_RANKINGS.items()},
-            "last_partial_rankings": {str(k): v for k, v in LAST_PARTIAL_RANKINGS.items()},
-            "watch_message_ids": {str(k): v for k, v in WATCH_MESSAGE_IDS.items()},
+            "last_scores": LAST_SCORES,
+            "last_rankings": LAST_RANKINGS,
+            "last_split_rankings": LAST_SPLIT_RANKINGS,
+            "last_partial_rankings": LAST_PARTIAL_RANKINGS,
+            "watch_message_ids": WATCH_MESSAGE_IDS,
             "watcher_phases": {str(k): v.value for k, v in WATCHER_PHASES.items()},
-            "reminder_schedules": {str(k): v for k, v in REMINDER_SCHEDULES.items()},
-            "stale_counters": {str(k): v for k, v in STALE_COUNTERS.items()},
-            "current_backoff": {str(k): v for k, v in CURRENT_BACKOFF.items()},
-            "last_score_change_at": {str(k): v for k, v in LAST_SCORE_CHANGE_AT.items()},
-            "is_stale": {str(k): v for k, v in IS_STALE.items()},
+            "reminder_schedules": REMINDER_SCHEDULES,
+            "stale_counters": STALE_COUNTERS,
+            "current_backoff": CURRENT_BACKOFF,
+            "last_score_change_at": LAST_SCORE_CHANGE_AT,
+            "is_stale": IS_STALE,
             "completed_round_cache": COMPLETED_ROUND_CACHE,
+            "last_sent_hash": _last_sent_digests(),
             "last_updated": datetime.now(timezone.utc).isoformat(),
         }
-        with open(RUNTIME_STATE_FILE, "w") as f:
-            json.dump(state, f, indent=2)
+        _persist_runtime_state(state)
         logger.debug("Runtime state saved")
     except Exception as e:
         logger.error(f"Could not save runtime state: {e}")
 
 
+# Live-phase saves from every watcher within this window collapse into one write
+STATE_SAVE_DELAY = 2.0
+_pending_state_save: Optional[asyncio.TimerHandle] = None
+
+
+def schedule_runtime_state_save() -> None:
+    """Request a runtime state save, coalesced with other requests in the next few seconds."""
+    global _pending_state_save
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _flush_scheduled_state_save()
+        return
+    if _pending_state_save is None:
+        _pending_state_save = loop.call_later(STATE_SAVE_DELAY, _flush_scheduled_state_save)
+
+
+def _flush_scheduled_state_save() -> None:
+    from .state import WATCHERS
+    write_runtime_state(list(WATCHERS.keys()))
+
+
+def flush_runtime_state_save() -> None:
+    """Write a scheduled runtime state save now (called on bot shutdown)."""
+    if _pending_state_save is not None:
+        _flush_scheduled_state_save()
+
+
 def write_runtime_state(active_chats: List[int]) -> None:
+    global _pending_state_save
+    # This write covers any save still waiting in the coalescing window
+    if _pending_state_save is not None:
+        _pending_state_save.cancel()
+        _pending_state_save = None
+
     # Import state variables at function level to ensure we get the current module's copies
     from .watchers import (
         LAST_SCORES, LAST_RANKINGS, LAST_SPLIT_RANKINGS, WATCH_MESSAGE_IDS,
@@ -147,47 +230,121 @@ def write_runtime_state(active_chats: List[int]) -> None:
     
     try:
         # Debug logging to see what state variables contain
-        logger.debug(f"write_runtime_state called with active_chats: {active_chats}")
-        logger.debug(f"WATCHER_PHASES content: {WATCHER_PHASES}")
-        logger.debug(f"REMINDER_SCHEDULES content: {REMINDER_SCHEDULES}")
-        logger.debug(f"STALE_COUNTERS content: {STALE_COUNTERS}")
-        logger.debug(f"CURRENT_BACKOFF content: {CURRENT_BACKOFF}")
+        logger.debug("write_runtime_state called with active_chats: %s", active_chats)
+        logger.debug("WATCHER_PHASES content: %s", WATCHER_PHASES)
+        logger.debug("REMINDER_SCHEDULES content: %s", REMINDER_SCHEDULES)
+        logger.debug("STALE_COUNTERS content: %s", STALE_COUNTERS)
+        logger.debug("CURRENT_BACKOFF content: %s", CURRENT_BACKOFF)
         
+        # Chat-id keyed dicts go in as-is: both serializers write int keys as strings
         state = {
             "active_chats": list(active_chats),
-            "last_scores": {str(k): v for k, v in LAST_SCORES.items()},
-            "last_rankings": {str(k): v for k, v in LAST_RANKINGS.items()},
-            "last_split_rankings": {str(k): v for k, v in LAST_SPLIT_RANKINGS.items()},
-            "last_partial_rankings": {str(k): v for k, v in LAST_PARTIAL_RANKINGS.items()},
-            "watch_message_ids": {str(k): v for k, v in WATCH_MESSAGE_IDS.items()},
+            "last_scores": LAST_SCORES,
+            "last_rankings": LAST_RANKINGS,
+            "last_split_rankings": LAST_SPLIT_RANKINGS,
+            "last_partial_rankings": LAST_PARTIAL_RANKINGS,
+            "watch_message_ids": WATCH_MESSAGE_IDS,
             "watcher_phases": {str(k): v.value for k, v in WATCHER_PHASES.items()},
-            "reminder_schedules": {str(k): v for k, v in REMINDER_SCHEDULES.items()},
-            "stale_counters": {str(k): v for k, v in STALE_COUNTERS.items()},
-            "current_backoff": {str(k): v for k, v in CURRENT_BACKOFF.items()},
-            "last_score_change_at": {str(k): v for k, v in LAST_SCORE_CHANGE_AT.items()},
-            "is_stale": {str(k): v for k, v in IS_STALE.items()},
-            "no_change_polls": {str(k): v for k, v in NO_CHANGE_POLLS.items()},
+            "reminder_schedules": REMINDER_SCHEDULES,
+            "stale_counters": STALE_COUNTERS,
+            "current_backoff": CURRENT_BACKOFF,
+            "last_score_change_at": LAST_SCORE_CHANGE_AT,
+            "is_stale": IS_STALE,
+            "no_change_polls": NO_CHANGE_POLLS,
             "completed_round_cache": COMPLETED_ROUND_CACHE,
+            "last_sent_hash": _last_sent_digests(),
             "last_updated": datetime.now(timezone.utc).isoformat(),
         }
-        with open(RUNTIME_STATE_FILE, "w") as f:
-            json.dump(state, f, indent=2)
-        logger.debug(f"Runtime state saved successfully with watcher_phases: {state['watcher_phases']}")
+        _persist_runtime_state(state)
+        logger.debug("Runtime state saved successfully with watcher_phases: %s", state['watcher_phases'])
     except Exception as e:
         logger.error(f"Could not save runtime state: {e}")
 
 
+def _last_sent_digests() -> Dict[str, str]:
+    """Digest of the last message sent per chat, hashed at save time rather than per poll."""
+    from .state import LAST_SENT_HASH, LAST_SENT_TEXT
+
+    digests = {str(k): v for k, v in LAST_SENT_HASH.items()}
+    digests.update({str(k): hash_payload(v) for k, v in LAST_SENT_TEXT.items()})
+    return digests
+
+
+# Serializes file writes; sequence numbers stop an older snapshot overwriting a newer one
+_STATE_WRITE_LOCK = threading.Lock()
+_STATE_SEQ = itertools.count(1)
+_last_written_seq = 0
+# Last persisted state without its timestamp; most polls change nothing, so those writes are skipped
+_last_state_body: Optional[bytes] = None
+
+
+def _persist_runtime_state(state: Dict[str, Any]) -> None:
+    """Serialize state now and write it off the event loop when one is running.
+
+    The snapshot is taken on the caller's thread, since the state dicts keep
+    changing; only the disk I/O moves to a worker thread. Nothing is written
+    when the state matches the last persisted one apart from "last_updated".
+    """
+    global _last_state_body
+    stamp = state.pop("last_updated", None)
+    body = _json_dumps(state)
+    if body == _last_state_body:
+        logger.debug("Runtime state unchanged, skipping write")
+        return
+    _last_state_body = body
+    payload = body
+    if stamp is not None and body.endswith(b"}") and body != b"{}":
+        # Splice the timestamp into the compact JSON instead of serializing twice
+        payload = body[:-1] + b',"last_updated":' + _json_dumps(stamp) + b"}"
+    _write_off_loop(_write_runtime_state_file, payload, next(_STATE_SEQ))
+
+
+def _write_runtime_state_file(payload: bytes, seq: int) -> None:
+    global _last_written_seq, _last_state_body
+    with _STATE_WRITE_LOCK:
+        if seq < _last_written_seq:
+            return
+        try:
+            _atomic_write(RUNTIME_STATE_FILE, payload)
+            _last_written_seq = seq
+        except Exception as e:
+            # Let the next save retry even if the state hasn't changed
+            _last_state_body = None
+            logger.error(f"Could not write runtime state file: {e}")
+
+
 def get_active_chats_to_resume() -> List[int]:
+    if _LOADED_ACTIVE_CHATS is not None:
+        return list(_LOADED_ACTIVE_CHATS)
     try:
         if os.path.exists(RUNTIME_STATE_FILE):
-            with open(RUNTIME_STATE_FILE, "r") as f:
-                state = json.load(f)
+            with open(RUNTIME_STATE_FILE, "rb") as f:
+                state = _json_loads(f.read())
             return [int(chat_id) for chat_id in state.get("active_chats", [])]
     except Exception as e:
         logger.error(f"Could not load active chats list: {e}")
     return []
 
 
+def load_commands_hash() -> Optional[str]:
+    """Hash of the bot command menus last registered with Telegram, if known."""
+    try:
+        if os.path.exists(COMMANDS_HASH_FILE):
+            with open(COMMANDS_HASH_FILE, "r", encoding="utf-8") as f:
+                return f.read().strip() or None
+    except Exception as e:
+        logger.error(f"Could not load commands hash: {e}")
+    return None
+
+
+def save_commands_hash(digest: str) -> None:
+    try:
+        with open(COMMANDS_HASH_FILE, "w", encoding="utf-8") as f:
+            f.write(digest)
+    except Exception as e:
+        logger.error(f"Could not save commands hash: {e}")
+
+
 def get_group_league(chat_id: int) -> Optional[str]:
     return GROUP_SETTINGS.get(str(chat_id), {}).get("league")
 
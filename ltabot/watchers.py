@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import time
+from operator import itemgetter
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Tuple, Optional
 
@@ -11,9 +14,11 @@ from .config import (
     MAX_STALE_POLLS,
     BACKOFF_MULTIPLIER,
     MAX_POLL_SECS,
+    ROSTER_CONCURRENCY,
     logger,
+    single_flight,
 )
-from .http import make_session
+from .http import get_session
 from .api import (
     get_rounds,
     get_league_ranking,
@@ -30,10 +35,12 @@ from .formatting import (
     fmt_market_open_notification,
     fmt_manual_split_ranking,
     hash_payload,
+    strip_timestamp,
 )
 from .state import (
     WATCHERS,
     LAST_SENT_HASH,
+    LAST_SENT_TEXT,
     WATCH_MESSAGE_IDS,
     LAST_SCORES,
     LAST_RANKINGS,
@@ -52,38 +59,45 @@ from .state import (
     LAST_SCORE_CHANGE_AT,
     IS_STALE,
     NO_CHANGE_POLLS,
+    ERROR_STREAKS,
+    CHAT_STATE_STORES,
 )
-from .storage import write_runtime_state
+from .storage import schedule_runtime_state_save, write_runtime_state
+
+# Caps concurrent roster requests across all fan-outs (keeps us under the connector's per-host limit)
+ROSTER_SEMAPHORE = asyncio.Semaphore(max(ROSTER_CONCURRENCY, 1))
 
 
 async def gather_live_scores(league_slug: str) -> Tuple[str, Dict[str, Any]]:
     """Gather live scores for the league - legacy compatibility function."""
-    logger.debug(f"Gathering split scores for league: {league_slug}")
-    async with make_session() as session:
-        rounds = await get_rounds(session, league_slug)
-        if not rounds:
-            logger.warning(f"No rounds found for league: {league_slug}")
-            raise RuntimeError("No rounds. Check league slug or token.")
-        round_obj = pick_latest_round(rounds)
-        if not round_obj:
-            logger.warning(f"No current round found for league: {league_slug}")
-            raise RuntimeError("Could not select a round.")
-        round_id = round_obj["id"]
-        ranking = await get_league_ranking(session, league_slug, round_id)
-
-        rows: List[Tuple[int, str, str, float]] = []
-        if ranking:
-            for item in ranking:
-                rank = item.get("rank", 0)
-                team = item["userTeam"]["name"]
-                owner = item["userTeam"].get("ownerName") or "—"
-                split_score = item.get("score", 0.0)
-                rows.append((rank, team, owner, float(split_score)))
-            rows.sort(key=lambda r: (-r[3], r[0]))
-
-        msg = fmt_standings(league_slug, round_obj, rows, score_type="Split")
-        logger.info(f"Generated split standings for {league_slug}: {len(rows)} teams")
-        return msg, round_obj
+    logger.debug("Gathering split scores for league: %s", league_slug)
+    session = await get_session()
+    rounds = await get_rounds(session, league_slug)
+    if not rounds:
+        logger.warning(f"No rounds found for league: {league_slug}")
+        raise RuntimeError("No rounds. Check league slug or token.")
+    round_obj = pick_latest_round(rounds)
+    if not round_obj:
+        logger.warning(f"No current round found for league: {league_slug}")
+        raise RuntimeError("Could not select a round.")
+    rows = await get_split_ranking(session, league_slug, round_obj["id"])
+
+    msg = fmt_standings(league_slug, round_obj, rows, score_type="Split")
+    logger.info(f"Generated split standings for {league_slug}: {len(rows)} teams")
+    return msg, round_obj
+
+
+def _sort_standings(rows: List[Tuple]) -> None:
+    """Sort rows in place by score desc, then rank asc.
+
+    Two stable C-keyed passes instead of a Python lambda building a tuple per row,
+    skipped entirely when the rows already arrive in that order (the usual case,
+    since the API ranks by score).
+    """
+    if all(a[3] > b[3] or (a[3] == b[3] and a[0] <= b[0]) for a, b in zip(rows, rows[1:])):
+        return
+    rows.sort(key=itemgetter(0))
+    rows.sort(key=itemgetter(3), reverse=True)
 
 
 async def get_split_ranking(session: aiohttp.ClientSession, league_slug: str, round_id: str) -> List[Tuple[int, str, str, float]]:
@@ -96,7 +110,7 @@ async def get_split_ranking(session: aiohttp.ClientSession, league_slug: str, ro
         owner = item["userTeam"].get("ownerName") or "—"
         split_score = item.get("score", 0.0)
         rows.append((rank, team, owner, float(split_score)))
-    rows.sort(key=lambda r: (-r[3], r[0]))
+    _sort_standings(rows)
     return rows
 
 
@@ -109,7 +123,8 @@ async def get_round_scores(session: aiohttp.ClientSession, league_slug: str, rou
         team = item["userTeam"]["name"]
         owner = item["userTeam"].get("ownerName") or "—"
         team_id = item["userTeam"]["id"]
-        roster = await get_team_round_roster(session, round_id, team_id)
+        async with ROSTER_SEMAPHORE:
+            roster = await get_team_round_roster(session, round_id, team_id)
         
         # Check if team has no roster
         if roster.get("no_roster", False):
@@ -124,43 +139,55 @@ async def get_round_scores(session: aiohttp.ClientSession, league_slug: str, rou
     rows: List[Tuple[int, str, str, float, bool]] = []
     if ranking:
         rows = await asyncio.gather(*[get_team_round_score(it) for it in ranking])
-        rows.sort(key=lambda r: (-r[3], r[0]))  # Sort by score desc, then by rank asc
+        _sort_standings(rows)
 
     return rows
 
 
+# In-flight get_structured_scores fetches per league, shared by all watching chats
+_STRUCTURED_SCORES_INFLIGHT: Dict[str, asyncio.Task] = {}
+
+
 async def get_structured_scores(league: str):
-    """Get structured scores for live tracking - legacy compatibility."""
-    async with make_session() as session:
-        rounds = await get_rounds(session, league)
-        if not rounds:
-            return {}, [], [], None
+    """Get structured scores for live tracking - legacy compatibility.
 
-        current_round = pick_current_round(rounds)
-        if not current_round:
-            latest_round = pick_latest_round(rounds)
-            return {}, [], [], latest_round
+    Watchers of the same league polling at the same time share one fetch.
+    Callers must not mutate the returned structures.
+    """
+    return await single_flight(_STRUCTURED_SCORES_INFLIGHT, league, lambda: _fetch_structured_scores(league))
 
-        round_id = current_round["id"]
-        teams_data = await get_round_scores(session, league, round_id)
-        if not teams_data:
-            return {}, [], [], current_round
 
-        current_scores: Dict[str, float] = {}
-        current_ranking: List[str] = []
-        for rank, team_name, owner_name, pts, no_roster in teams_data:
-            current_scores[team_name] = pts
-            current_ranking.append(team_name)
+async def _fetch_structured_scores(league: str):
+    session = await get_session()
+    rounds = await get_rounds(session, league)
+    if not rounds:
+        return {}, [], [], None
+
+    current_round = pick_current_round(rounds)
+    if not current_round:
+        latest_round = pick_latest_round(rounds)
+        return {}, [], [], latest_round
+
+    round_id = current_round["id"]
+    teams_data = await get_round_scores(session, league, round_id)
+    if not teams_data:
+        return {}, [], [], current_round
 
-        return current_scores, current_ranking, teams_data, current_round
+    current_scores: Dict[str, float] = {}
+    current_ranking: List[str] = []
+    for rank, team_name, owner_name, pts, no_roster in teams_data:
+        current_scores[team_name] = pts
+        current_ranking.append(team_name)
+
+    return current_scores, current_ranking, teams_data, current_round
 
 
 async def get_structured_split_ranking(league: str, round_id: str):
     """Get structured split ranking data."""
-    async with make_session() as session:
-        teams_data = await get_split_ranking(session, league, round_id)
-        split_ranking = [team_name for rank, team_name, owner_name, score in teams_data]
-        return split_ranking, teams_data
+    session = await get_session()
+    teams_data = await get_split_ranking(session, league, round_id)
+    split_ranking = [team_name for rank, team_name, owner_name, score in teams_data]
+    return split_ranking, teams_data
 
 
 async def calculate_partial_ranking_optimized(league: str) -> Tuple[List[str], List[Tuple[int, str, str, float]]]:
@@ -168,74 +195,78 @@ async def calculate_partial_ranking_optimized(league: str) -> Tuple[List[str], L
     Optimized partial ranking calculation using the new /user-teams/{id}/round-stats endpoint.
     Makes only O(teams) API calls instead of O(teams × rounds).
     """
-    async with make_session() as session:
-        # Get team list from latest round
-        rounds = await get_rounds(session, league)
-        if not rounds:
-            return [], []
-        
-        latest_round = pick_latest_round(rounds)
-        if not latest_round:
-            return [], []
-            
-        ranking = await get_league_ranking(session, league, latest_round["id"])
-        if not ranking:
-            return [], []
-            
-        # Build team list with IDs, names, and owners
-        teams_info = [(item["userTeam"]["id"], item["userTeam"]["name"], item["userTeam"].get("ownerName") or "—") 
-                     for item in ranking]
-        
-        # Get all round stats for each team using the efficient new endpoint
-        team_totals: Dict[str, float] = {}
-        team_owners: Dict[str, str] = {}
-        
-        for team_id, team_name, owner_name in teams_info:
-            try:
-                # Single API call gets all round data for this team
+    session = await get_session()
+    # Get team list from latest round
+    rounds = await get_rounds(session, league)
+    if not rounds:
+        return [], []
+    
+    latest_round = pick_latest_round(rounds)
+    if not latest_round:
+        return [], []
+    
+    ranking = await get_league_ranking(session, league, latest_round["id"])
+    if not ranking:
+        return [], []
+    
+    # Build team list with IDs, names, and owners
+    teams_info = [(item["userTeam"]["id"], item["userTeam"]["name"], item["userTeam"].get("ownerName") or "—") 
+                 for item in ranking]
+    
+    async def get_team_total(team_id: str, team_name: str) -> float:
+        try:
+            # Single API call gets all round data for this team
+            async with ROSTER_SEMAPHORE:
                 round_stats = await get_user_team_round_stats(session, team_id)
-                
-                total_score = 0.0
-                for round_stat in round_stats:
-                    round_status = round_stat.get("status", "")
-                    if round_status in ["completed", "in_progress"]:
-                        # For completed rounds, use the score from round-stats
-                        # For in_progress rounds, score will be null, so get live score
-                        score = round_stat.get("score")
-                        if score is not None:
-                            total_score += float(score)
-                        elif round_status == "in_progress":
-                            # Get live score for in_progress round
-                            try:
-                                round_id = round_stat["id"]
+    
+            total_score = 0.0
+            for round_stat in round_stats:
+                round_status = round_stat.get("status", "")
+                if round_status in ["completed", "in_progress"]:
+                    # For completed rounds, use the score from round-stats
+                    # For in_progress rounds, score will be null, so get live score
+                    score = round_stat.get("score")
+                    if score is not None:
+                        total_score += float(score)
+                    elif round_status == "in_progress":
+                        # Get live score for in_progress round
+                        try:
+                            round_id = round_stat["id"]
+                            async with ROSTER_SEMAPHORE:
                                 roster = await get_team_round_roster(session, round_id, team_id)
-                                rr = roster.get("roundRoster") or {}
-                                live_pts = rr.get("pointsPartial")
-                                if live_pts is None:
-                                    live_pts = rr.get("points") or 0.0
-                                total_score += float(live_pts)
-                            except Exception as e:
-                                logger.warning(f"Could not get live score for team {team_name} in round {round_id}: {e}")
-                
-                team_totals[team_name] = total_score
-                team_owners[team_name] = owner_name
-                
-            except Exception as e:
-                logger.warning(f"Could not get round stats for team {team_name} ({team_id}): {e}")
-                team_totals[team_name] = 0.0
-                team_owners[team_name] = owner_name
-        
-        # Convert to sorted list for formatting
-        team_results = [(team_name, team_owners[team_name], total_score) 
-                       for team_name, total_score in team_totals.items()]
-        team_results.sort(key=lambda x: x[2], reverse=True)  # Sort by total score desc
-        
-        # Add rank numbers
-        teams_data = [(i+1, team_name, owner_name, total_score) 
-                     for i, (team_name, owner_name, total_score) in enumerate(team_results)]
-        ranking_list = [team_name for _, team_name, _, _ in teams_data]
-        
-        return ranking_list, teams_data
+                            rr = roster.get("roundRoster") or {}
+                            live_pts = rr.get("pointsPartial")
+                            if live_pts is None:
+                                live_pts = rr.get("points") or 0.0
+                            total_score += float(live_pts)
+                        except Exception as e:
+                            logger.warning(f"Could not get live score for team {team_name} in round {round_id}: {e}")
+            return total_score
+    
+        except Exception as e:
+            logger.warning(f"Could not get round stats for team {team_name} ({team_id}): {e}")
+            return 0.0
+
+    # Fetch all teams concurrently; the shared semaphore bounds in-flight requests
+    totals = await asyncio.gather(*[get_team_total(team_id, team_name) for team_id, team_name, _ in teams_info])
+
+    team_totals: Dict[str, float] = {}
+    team_owners: Dict[str, str] = {}
+    for (team_id, team_name, owner_name), total_score in zip(teams_info, totals):
+        team_totals[team_name] = total_score
+        team_owners[team_name] = owner_name
+    
+    # Convert to sorted list for formatting
+    team_results = [(team_name, team_owners[team_name], total_score) 
+                   for team_name, total_score in team_totals.items()]
+    team_results.sort(key=lambda x: x[2], reverse=True)  # Sort by total score desc
+    
+    # Add rank numbers
+    teams_data = [(i+1, team_name, owner_name, total_score) 
+                 for i, (team_name, owner_name, total_score) in enumerate(team_results)]
+    ranking_list = [team_name for _, team_name, _, _ in teams_data]
+    
+    return ranking_list, teams_data
 
 
 async def calculate_partial_ranking(league: str) -> Tuple[List[str], List[Tuple[int, str, str, float]]]:
@@ -277,19 +308,14 @@ def invalidate_completed_round_cache():
 
 def calculate_score_changes(chat_id: int, current_scores: Dict[str, float]) -> Dict[str, str]:
     """Calculate score changes between polls."""
-    score_changes: Dict[str, str] = {}
-    for team_name, current_score in current_scores.items():
-        if chat_id in LAST_SCORES and team_name in LAST_SCORES[chat_id]:
-            previous_score = LAST_SCORES[chat_id][team_name]
-            if current_score > previous_score:
-                score_changes[team_name] = "⬆️"
-            elif current_score < previous_score:
-                score_changes[team_name] = "⬇️"
-            else:
-                score_changes[team_name] = ""
-        else:
-            score_changes[team_name] = ""
-    return score_changes
+    previous_get = LAST_SCORES.get(chat_id, {}).get
+    # A team with no previous score compares against itself and gets no arrow
+    return {
+        team_name: "⬆️" if current_score > (prev := previous_get(team_name, current_score))
+        else "⬇️" if current_score < prev
+        else ""
+        for team_name, current_score in current_scores.items()
+    }
 
 
 def check_ranking_changed(chat_id: int, current_ranking: List[str]) -> bool:
@@ -336,13 +362,28 @@ async def send_partial_ranking_change_notification(bot, chat_id: int, league: st
     await bot.send_message(chat_id, ranking_msg, parse_mode="HTML")
 
 
+def _forget_watch_message(chat_id: int):
+    """Drop the live message id and its dedup state so the next poll sends a new message."""
+    WATCH_MESSAGE_IDS.pop(chat_id, None)
+    LAST_SENT_TEXT.pop(chat_id, None)
+    LAST_SENT_HASH.pop(chat_id, None)
+
+
 async def send_or_edit_message(bot, chat_id: int, message: str, force_new: bool):
     """Send new message or edit existing watch message."""
-    # Check if message content has changed
-    current_hash = hash_payload(message)
-    if not force_new and chat_id in LAST_SENT_HASH and LAST_SENT_HASH[chat_id] == current_hash:
-        logger.debug(f"Message content unchanged for chat {chat_id}, skipping edit/send")
+    # Compare without the "updated at" footer so a poll with no score changes
+    # makes no Telegram call at all
+    content = strip_timestamp(message)
+    if not force_new and LAST_SENT_TEXT.get(chat_id) == content:
+        logger.debug("Message content unchanged for chat %s, skipping edit/send", chat_id)
         return
+
+    # After a restart only the persisted digest is known; hash just for that check
+    if not force_new and chat_id not in LAST_SENT_TEXT and chat_id in LAST_SENT_HASH:
+        if LAST_SENT_HASH[chat_id] == hash_payload(content):
+            logger.debug("Message content unchanged since restart for chat %s, skipping edit/send", chat_id)
+            LAST_SENT_TEXT[chat_id] = content
+            return
     
     # Always try to edit first if we have a message ID and not forcing new
     if chat_id in WATCH_MESSAGE_IDS and not force_new:
@@ -353,62 +394,54 @@ async def send_or_edit_message(bot, chat_id: int, message: str, force_new: bool)
                 text=message, 
                 parse_mode="HTML"
             )
-            logger.debug(f"Successfully edited message {WATCH_MESSAGE_IDS[chat_id]} for chat {chat_id}")
-            LAST_SENT_HASH[chat_id] = current_hash
+            logger.debug("Successfully edited message %s for chat %s", WATCH_MESSAGE_IDS[chat_id], chat_id)
+            LAST_SENT_TEXT[chat_id] = content
             return
         except Exception as e:
             # Check if it's just "Message is not modified" error - treat as success
             if "Message is not modified" in str(e):
-                logger.debug(f"Message {WATCH_MESSAGE_IDS[chat_id]} for chat {chat_id} unchanged (as expected)")
-                LAST_SENT_HASH[chat_id] = current_hash
+                logger.debug("Message %s for chat %s unchanged (as expected)", WATCH_MESSAGE_IDS[chat_id], chat_id)
+                LAST_SENT_TEXT[chat_id] = content
                 return
             
             logger.warning(f"Failed to edit message {WATCH_MESSAGE_IDS[chat_id]} for chat {chat_id}: {e}")
             # Clear the message ID since it's no longer valid
-            WATCH_MESSAGE_IDS.pop(chat_id, None)
+            _forget_watch_message(chat_id)
     
     # Send new message
     try:
         sent_message = await bot.send_message(chat_id, message, parse_mode="HTML")
         WATCH_MESSAGE_IDS[chat_id] = sent_message.message_id
-        LAST_SENT_HASH[chat_id] = current_hash
-        logger.debug(f"Sent new message {sent_message.message_id} for chat {chat_id}")
+        LAST_SENT_TEXT[chat_id] = content
+        logger.debug("Sent new message %s for chat %s", sent_message.message_id, chat_id)
     except Exception as e:
         logger.error(f"Failed to send message to chat {chat_id}: {e}")
 
 
 def update_tracking_data(chat_id: int, current_scores: Dict[str, float], current_ranking: List[str], 
-                        current_split_ranking: List[str], current_partial_ranking: List[str], message: str):
-    """Update tracking data for change detection."""
-    LAST_SCORES[chat_id] = current_scores.copy()
-    LAST_RANKINGS[chat_id] = current_ranking.copy()
-    LAST_SPLIT_RANKINGS[chat_id] = current_split_ranking.copy()
-    LAST_PARTIAL_RANKINGS[chat_id] = current_partial_ranking.copy()
+                        current_split_ranking: List[str], current_partial_ranking: List[str],
+                        *, score_changes: Dict[str, str]):
+    """Update tracking data for change detection.
+
+    Stores references, not copies: every poll builds fresh structures and
+    nothing mutates them afterwards (they may be shared between chats).
+    """
+    LAST_SCORES[chat_id] = current_scores
+    LAST_RANKINGS[chat_id] = current_ranking
+    LAST_SPLIT_RANKINGS[chat_id] = current_split_ranking
+    LAST_PARTIAL_RANKINGS[chat_id] = current_partial_ranking
     # Store UTC time internally, format to BRT only for display
     from datetime import datetime, timezone
-    # Only update LAST_SCORE_CHANGE_AT if any score actually changed (arrow up/down in message)
-    if any(sym in message for sym in ["⬆️", "⬇️"]):
+    # Only update LAST_SCORE_CHANGE_AT if any score actually changed (an up/down arrow)
+    if any(score_changes.values()):
         current_utc = datetime.now(timezone.utc).isoformat()
         LAST_SCORE_CHANGE_AT[chat_id] = current_utc
 
 
 def cleanup_chat_data(chat_id: int):
     """Clean up chat-specific tracking data."""
-    LAST_SCORES.pop(chat_id, None)
-    LAST_RANKINGS.pop(chat_id, None)
-    LAST_SPLIT_RANKINGS.pop(chat_id, None)
-    LAST_PARTIAL_RANKINGS.pop(chat_id, None)
-    CACHED_PARTIAL_RANKINGS.pop(chat_id, None)
-    WATCH_MESSAGE_IDS.pop(chat_id, None)
-    FIRST_POLL_AFTER_RESUME.pop(chat_id, None)
-    WATCHER_PHASES.pop(chat_id, None)
-    STALE_COUNTERS.pop(chat_id, None)
-    CURRENT_BACKOFF.pop(chat_id, None)
-    REMINDER_SCHEDULES.pop(chat_id, None)
-    PHASE_CHANGE_EVENTS.pop(chat_id, None)
-    LAST_SCORE_CHANGE_AT.pop(chat_id, None)
-    IS_STALE.pop(chat_id, None)
-    NO_CHANGE_POLLS.pop(chat_id, None)
+    for store in CHAT_STATE_STORES:
+        store.pop(chat_id, None)
     
     # Cancel any scheduled tasks for this chat
     if chat_id in SCHEDULED_TASKS:
@@ -420,7 +453,7 @@ def cleanup_chat_data(chat_id: int):
 
 def initialize_phase_state(chat_id: int, phase: WatcherPhase):
     """Initialize the phase state for a chat."""
-    logger.debug(f"initialize_phase_state called for chat {chat_id} with phase {phase.value}")
+    logger.debug("initialize_phase_state called for chat %s with phase %s", chat_id, phase.value)
     WATCHER_PHASES[chat_id] = phase
     # Only initialize counters if they don't already exist (preserves loaded state)
     if chat_id not in STALE_COUNTERS:
@@ -437,7 +470,7 @@ def initialize_phase_state(chat_id: int, phase: WatcherPhase):
     if phase == WatcherPhase.LIVE and chat_id not in LAST_SCORE_CHANGE_AT:
         from datetime import datetime, timezone
         LAST_SCORE_CHANGE_AT[chat_id] = datetime.now(timezone.utc).isoformat()
-        logger.debug(f"Initialized LAST_SCORE_CHANGE_AT for chat {chat_id} at start of LIVE tracking")
+        logger.debug("Initialized LAST_SCORE_CHANGE_AT for chat %s at start of LIVE tracking", chat_id)
     
     # Initialize or trigger phase change event
     if chat_id not in PHASE_CHANGE_EVENTS:
@@ -448,9 +481,9 @@ def initialize_phase_state(chat_id: int, phase: WatcherPhase):
         # Reset for next phase change
         PHASE_CHANGE_EVENTS[chat_id] = asyncio.Event()
     
-    logger.debug(f"After initialization - WATCHER_PHASES: {WATCHER_PHASES}")
-    logger.debug(f"After initialization - REMINDER_SCHEDULES: {REMINDER_SCHEDULES}")
-    logger.debug(f"After initialization - STALE_COUNTERS: {STALE_COUNTERS}")
+    logger.debug("After initialization - WATCHER_PHASES: %s", WATCHER_PHASES)
+    logger.debug("After initialization - REMINDER_SCHEDULES: %s", REMINDER_SCHEDULES)
+    logger.debug("After initialization - STALE_COUNTERS: %s", STALE_COUNTERS)
     # Persist immediately so external monitoring sees phase change
     try:
         write_runtime_state(list(WATCHERS.keys()))
@@ -471,7 +504,7 @@ def get_phase_poll_interval(phase: WatcherPhase, chat_id: int) -> Optional[float
     if chat_id in CURRENT_BACKOFF and CURRENT_BACKOFF[chat_id] > 1.0:
         backoff = CURRENT_BACKOFF[chat_id]
         interval = min(base_interval * backoff, MAX_POLL_SECS)
-        logger.debug(f"Applying backoff {backoff}x to {phase.value}: {interval}s (max: {MAX_POLL_SECS}s)")
+        logger.debug("Applying backoff %sx to %s: %ss (max: %ss)", backoff, phase.value, interval, MAX_POLL_SECS)
         return interval
     
     return float(base_interval)
@@ -495,7 +528,7 @@ def update_stale_counter(chat_id: int, has_changes: bool):
                 max_backoff
             )
             CURRENT_BACKOFF[chat_id] = new_backoff
-            logger.debug(f"Applied backoff {new_backoff:.1f}x for chat {chat_id}")
+            logger.debug("Applied backoff %.1fx for chat %s", new_backoff, chat_id)
             STALE_COUNTERS[chat_id] = 0  # Reset counter after applying backoff
 
 
@@ -508,7 +541,7 @@ def _create_reminder_task(delay: float, callback_func, chat_id: int, description
                 logger.info(f"Sending overdue {description} immediately for chat {chat_id} (was {delay:.0f}s late)")
             else:
                 # Schedule for future
-                logger.debug(f"Scheduling {description} for chat {chat_id} in {delay:.0f}s")
+                logger.debug("Scheduling %s for chat %s in %.0fs", description, chat_id, delay)
                 await asyncio.sleep(delay)
             
             # Execute the callback
@@ -516,7 +549,7 @@ def _create_reminder_task(delay: float, callback_func, chat_id: int, description
             write_runtime_state(list(WATCHERS.keys()))
             logger.info(f"Sent {description} for chat {chat_id}")
         except asyncio.CancelledError:
-            logger.debug(f"Cancelled {description} task for chat {chat_id}")
+            logger.debug("Cancelled %s task for chat %s", description, chat_id)
         except Exception as e:
             logger.error(f"Failed to send {description} to chat {chat_id}: {e}")
     
@@ -538,10 +571,10 @@ def _start_market_close_polling(chat_id: int, league: str, bot):
             
             while True:
                 try:
-                    async with make_session() as session:
-                        rounds = await get_rounds(session, league)
-                        latest_round = pick_latest_round(rounds) if rounds else None
-                        
+                    session = await get_session()
+                    rounds = await get_rounds(session, league)
+                    latest_round = pick_latest_round(rounds) if rounds else None
+                    
                     if latest_round and latest_round.get("status") == "in_progress":
                         # Success! API shows the round is now in progress
                         initialize_phase_state(chat_id, WatcherPhase.LIVE)
@@ -555,7 +588,7 @@ def _start_market_close_polling(chat_id: int, league: str, bot):
                         max_backoff = MAX_POLL_SECS / POLL_SECS
                         backoff_factor = min(BACKOFF_MULTIPLIER ** (poll_count // MAX_STALE_POLLS), max_backoff)
                         current_interval = POLL_SECS * backoff_factor
-                        logger.debug(f"Market close polling backoff {backoff_factor:.1f}x -> {current_interval}s for chat {chat_id}")
+                        logger.debug("Market close polling backoff %.1fx -> %ss for chat %s", backoff_factor, current_interval, chat_id)
                     
                     if poll_count % 10 == 0:  # Log every 10 polls
                         round_status = latest_round.get('status', 'unknown') if latest_round else 'no_round'
@@ -732,42 +765,44 @@ async def _collect_team_budget_data(session: aiohttp.ClientSession, league: str,
     ranking = await get_league_ranking(session, league, round_id)
     previous_round = pick_previous_round(rounds, round_obj)
     
-    team_budget_data = []
-    for item in ranking:
+    async def get_team_budget(item: Dict[str, Any]) -> Tuple:
         team_id = item["userTeam"]["id"]
         team_name = item["userTeam"]["name"]
         owner_name = item["userTeam"].get("ownerName", "Unknown")
         
         # Get previous round roster for budget and price info
-        if previous_round:
-            try:
+        if not previous_round:
+            return (team_name, owner_name, 0, 0, [])
+        try:
+            async with ROSTER_SEMAPHORE:
                 prev_roster = await get_team_round_roster(session, previous_round["id"], team_id)
-                prev_round_roster = prev_roster.get("roundRoster", {})
-                
-                pre_budget = prev_round_roster.get("preRoundBudget", 0)
-                post_budget = prev_round_roster.get("postRoundBudget", 0)
-                
-                # Get player price changes
-                player_changes = []
-                roster_players = prev_roster.get("rosterPlayers", [])
-                for player in roster_players:
-                    role = player.get("role", "unknown")
-                    esp = player.get("roundEsportsPlayer", {})
-                    pro_player = esp.get("proPlayer", {})
-                    player_name = pro_player.get("name", "Unknown")
-                    pre_price = esp.get("preRoundPrice", 0)
-                    post_price = esp.get("postRoundPrice", 0)
-                    
-                    if pre_price != post_price:  # Only include players with price changes
-                        player_changes.append((role, player_name, pre_price, post_price))
-                
-                team_budget_data.append((team_name, owner_name, pre_budget, post_budget, player_changes))
+            prev_round_roster = prev_roster.get("roundRoster", {})
+            
+            pre_budget = prev_round_roster.get("preRoundBudget", 0)
+            post_budget = prev_round_roster.get("postRoundBudget", 0)
+            
+            # Get player price changes
+            player_changes = []
+            roster_players = prev_roster.get("rosterPlayers", [])
+            for player in roster_players:
+                role = player.get("role", "unknown")
+                esp = player.get("roundEsportsPlayer", {})
+                pro_player = esp.get("proPlayer", {})
+                player_name = pro_player.get("name", "Unknown")
+                pre_price = esp.get("preRoundPrice", 0)
+                post_price = esp.get("postRoundPrice", 0)
                 
-            except Exception as e:
-                logger.warning(f"Could not get previous round data for team {team_name}: {e}")
-                team_budget_data.append((team_name, owner_name, 0, 0, []))
-        else:
-            team_budget_data.append((team_name, owner_name, 0, 0, []))
+                if pre_price != post_price:  # Only include players with price changes
+                    player_changes.append((role, player_name, pre_price, post_price))
+            
+            return (team_name, owner_name, pre_budget, post_budget, player_changes)
+            
+        except Exception as e:
+            logger.warning(f"Could not get previous round data for team {team_name}: {e}")
+            return (team_name, owner_name, 0, 0, [])
+    
+    # Previous-round rosters are independent per team; fetch them concurrently in ranking order
+    team_budget_data = list(await asyncio.gather(*[get_team_budget(item) for item in ranking]))
     
     return team_budget_data
 
@@ -775,16 +810,16 @@ async def _collect_team_budget_data(session: aiohttp.ClientSession, league: str,
 async def send_market_open_notification(chat_id: int, league: str, round_obj: Dict[str, Any], bot):
     """Send market open notification with budget and price deltas."""
     try:
-        async with make_session() as session:
-            rounds = await get_rounds(session, league)
-            team_budget_data = await _collect_team_budget_data(session, league, round_obj, rounds)
-            
-            # Format and send the market open notification
-            message = fmt_market_open_notification(round_obj, team_budget_data)
-            await bot.send_message(chat_id, message, parse_mode="HTML")
-            
-            logger.info(f"Sent market open notification for {league} to chat {chat_id}")
-            
+        session = await get_session()
+        rounds = await get_rounds(session, league)
+        team_budget_data = await _collect_team_budget_data(session, league, round_obj, rounds)
+        
+        # Format and send the market open notification
+        message = fmt_market_open_notification(round_obj, team_budget_data)
+        await bot.send_message(chat_id, message, parse_mode="HTML")
+        
+        logger.info(f"Sent market open notification for {league} to chat {chat_id}")
+        
     except Exception as e:
         logger.error(f"Failed to send market open notification to chat {chat_id}: {e}")
         # Send a simpler fallback notification
@@ -802,45 +837,45 @@ async def send_market_open_notification(chat_id: int, league: str, round_obj: Di
 async def compute_and_send_split_ranking(chat_id: int, league: str, completed_round: Dict[str, Any], bot):
     """Compute and send manual split ranking after round completion."""
     try:
-        async with make_session() as session:
-            rounds = await get_rounds(session, league)
-            if not rounds:
-                return
-            
-            # Get all rounds up to and including the completed round
-            completed_index = completed_round.get("indexInSplit", 0)
-            split_rounds = [r for r in rounds if r.get("indexInSplit", 0) <= completed_index and r.get("indexInSplit", 0) > 0]
-            split_rounds.sort(key=lambda r: r.get("indexInSplit", 0))
-            
-            # Aggregate scores per team across all split rounds
-            team_totals: Dict[str, Tuple[str, float]] = {}  # team_name -> (owner_name, total_score)
-            
-            for round_obj in split_rounds:
-                round_id = round_obj["id"]
-                try:
-                    round_teams = await get_round_scores(session, league, round_id)
-                    for _, team_name, owner_name, round_score, no_roster in round_teams:
-                        if team_name in team_totals:
-                            # Add to existing total
-                            existing_owner, existing_total = team_totals[team_name]
-                            team_totals[team_name] = (existing_owner, existing_total + round_score)
-                        else:
-                            # First time seeing this team
-                            team_totals[team_name] = (owner_name, round_score)
-                except Exception as e:
-                    logger.warning(f"Could not get scores for round {round_id}: {e}")
-                    continue
-            
-            # Convert to sorted list for formatting
-            split_totals = [(team_name, owner_name, total_score) for team_name, (owner_name, total_score) in team_totals.items()]
-            split_totals.sort(key=lambda x: x[2], reverse=True)  # Sort by total score desc
-            
-            # Format and send split ranking
-            if split_totals:
-                split_message = fmt_manual_split_ranking(league, completed_round, split_totals)
-                await bot.send_message(chat_id, split_message, parse_mode="HTML")
-                logger.info(f"Sent manual split ranking for {league} to chat {chat_id}")
-            
+        session = await get_session()
+        rounds = await get_rounds(session, league)
+        if not rounds:
+            return
+        
+        # Get all rounds up to and including the completed round
+        completed_index = completed_round.get("indexInSplit", 0)
+        split_rounds = [r for r in rounds if r.get("indexInSplit", 0) <= completed_index and r.get("indexInSplit", 0) > 0]
+        split_rounds.sort(key=lambda r: r.get("indexInSplit", 0))
+        
+        # Aggregate scores per team across all split rounds
+        team_totals: Dict[str, Tuple[str, float]] = {}  # team_name -> (owner_name, total_score)
+        
+        for round_obj in split_rounds:
+            round_id = round_obj["id"]
+            try:
+                round_teams = await get_round_scores(session, league, round_id)
+                for _, team_name, owner_name, round_score, no_roster in round_teams:
+                    if team_name in team_totals:
+                        # Add to existing total
+                        existing_owner, existing_total = team_totals[team_name]
+                        team_totals[team_name] = (existing_owner, existing_total + round_score)
+                    else:
+                        # First time seeing this team
+                        team_totals[team_name] = (owner_name, round_score)
+            except Exception as e:
+                logger.warning(f"Could not get scores for round {round_id}: {e}")
+                continue
+        
+        # Convert to sorted list for formatting
+        split_totals = [(team_name, owner_name, total_score) for team_name, (owner_name, total_score) in team_totals.items()]
+        split_totals.sort(key=lambda x: x[2], reverse=True)  # Sort by total score desc
+        
+        # Format and send split ranking
+        if split_totals:
+            split_message = fmt_manual_split_ranking(league, completed_round, split_totals)
+            await bot.send_message(chat_id, split_message, parse_mode="HTML")
+            logger.info(f"Sent manual split ranking for {league} to chat {chat_id}")
+        
     except Exception as e:
         logger.error(f"Failed to compute split ranking for chat {chat_id}: {e}")
 
@@ -857,7 +892,7 @@ async def handle_round_completion(chat_id: int, league: str, completed_round: Di
     # Check if we already handled completion for this round to avoid duplicates
     completion_flag_key = f"completion_{league}_{round_id}"
     if chat_id in REMINDER_SCHEDULES and completion_flag_key in REMINDER_SCHEDULES[chat_id]:
-        logger.debug(f"Completion already handled for round {round_name} in chat {chat_id}")
+        logger.debug("Completion already handled for round %s in chat %s", round_name, chat_id)
         return
     
     # Mark this round's completion as handled
@@ -870,6 +905,7 @@ async def handle_round_completion(chat_id: int, league: str, completed_round: Di
             await bot.delete_message(chat_id=chat_id, message_id=WATCH_MESSAGE_IDS[chat_id])
         except Exception:
             pass
+        _forget_watch_message(chat_id)
 
     try:
         # Send final round scores
@@ -936,10 +972,10 @@ def cleanup_watch_session(chat_id: int):
 
 async def _handle_pre_market_phase(chat_id: int, league: str, bot) -> Optional[WatcherPhase]:
     """Handle PRE_MARKET phase logic. Returns new phase if transition occurs."""
-    async with make_session() as session:
-        rounds = await get_rounds(session, league)
-        latest_round = pick_latest_round(rounds) if rounds else None
-        
+    session = await get_session()
+    rounds = await get_rounds(session, league)
+    latest_round = pick_latest_round(rounds) if rounds else None
+    
     if latest_round and latest_round.get("status") == "market_open":
         # Transition to MARKET_OPEN - reset stale counter since this is a change
         update_stale_counter(chat_id, True)
@@ -1031,13 +1067,14 @@ async def _handle_live_phase(chat_id: int, league: str, bot, is_resumed: bool, s
     
     if current_round:
         round_id = current_round["id"]
-        # Get split ranking (official API ranking for this round)
-        current_split_ranking, split_teams_data = await get_structured_split_ranking(league, round_id)
-        
-        # Calculate partial ranking based on completed rounds + current round live scores
-        # Refresh cache if this is not a resumed session to get latest current round scores
+        # Refresh partial ranking cache if this is not a resumed session to get latest current round scores
         force_refresh = not is_resumed
-        current_partial_ranking, partial_teams_data = await get_cached_partial_ranking(chat_id, league, force_refresh)
+        # Split ranking (official API ranking for this round) and partial ranking (completed
+        # rounds + current live scores) are independent, so fetch them concurrently
+        (current_split_ranking, split_teams_data), (current_partial_ranking, partial_teams_data) = await asyncio.gather(
+            get_structured_split_ranking(league, round_id),
+            get_cached_partial_ranking(chat_id, league, force_refresh),
+        )
 
         # Process changes and send notifications
         score_changes, partial_ranking_changed, split_ranking_changed = await process_score_and_ranking_changes(
@@ -1047,9 +1084,7 @@ async def _handle_live_phase(chat_id: int, league: str, bot, is_resumed: bool, s
 
         # Update tracking data
         update_tracking_data(chat_id, current_scores, current_ranking, current_split_ranking, 
-                           current_partial_ranking,
-                           fmt_standings(league, current_round, teams_data, score_changes, 
-                                       include_timestamp=True, score_type="Round"))
+                           current_partial_ranking, score_changes=score_changes)
 
         # Update stale counter and backoff
         has_changes = partial_ranking_changed or split_ranking_changed or any(arrow != "" for arrow in score_changes.values())
@@ -1071,7 +1106,7 @@ async def _handle_live_phase(chat_id: int, league: str, bot, is_resumed: bool, s
                 try:
                     await bot.delete_message(chat_id=chat_id, message_id=WATCH_MESSAGE_IDS[chat_id])
                     logger.info(f"Deleted stale message {WATCH_MESSAGE_IDS[chat_id]} for chat {chat_id}")
-                    WATCH_MESSAGE_IDS.pop(chat_id, None)
+                    _forget_watch_message(chat_id)
                 except Exception as e:
                     logger.warning(f"Failed to delete stale message for chat {chat_id}: {e}")
             # Send recovery notification before new live message
@@ -1100,7 +1135,7 @@ async def _handle_live_phase(chat_id: int, league: str, bot, is_resumed: bool, s
 
         # Save state if needed
         if should_save_state(save_counter, partial_ranking_changed, split_ranking_changed, score_changes):
-            write_runtime_state(list(WATCHERS.keys()))
+            schedule_runtime_state_save()
             save_counter = 0
     
     return None, save_counter
@@ -1126,7 +1161,7 @@ async def _execute_phase_logic(current_phase: WatcherPhase, chat_id: int, league
 async def _main_loop_iteration(current_phase: WatcherPhase, chat_id: int, league: str, bot, 
                               is_resumed: bool, save_counter: int) -> Tuple[Optional[WatcherPhase], int, bool]:
     """Execute one iteration of the main loop. Returns (new_phase, save_counter, should_break)."""
-    logger.debug(f"🔄 Main loop iteration: chat {chat_id}, phase {current_phase.value}, save_counter {save_counter}")
+    logger.debug("🔄 Main loop iteration: chat %s, phase %s, save_counter %s", chat_id, current_phase.value, save_counter)
     
     # Execute phase-specific logic
     new_phase, save_counter = await _execute_phase_logic(
@@ -1145,18 +1180,41 @@ async def _main_loop_iteration(current_phase: WatcherPhase, chat_id: int, league
     return current_phase, save_counter, False
 
 
-async def watch_loop(chat_id: int, league: str, bot, stop_event: asyncio.Event):
-    """Main stateful watch loop with phase-based polling."""
+async def _report_watch_error(bot, chat_id: int, error: str) -> float:
+    """Notify the chat of a watch error, collapsing repeats. Returns the backoff delay.
+
+    Identical consecutive errors are only sent on the 1st, 2nd, 4th, 8th, ...
+    occurrence, and the next poll is delayed exponentially (with jitter) so an
+    API outage doesn't flood Telegram from every watching chat at once.
+    """
+    last_error, streak = ERROR_STREAKS.get(chat_id, ("", 0))
+    streak = streak + 1 if error == last_error else 1
+    ERROR_STREAKS[chat_id] = (error, streak)
+
+    if streak & (streak - 1) == 0:
+        suffix = f" (still failing, {streak}x in a row)" if streak > 1 else ""
+        try:
+            await bot.send_message(chat_id, f"❌ Watch error: {error}{suffix}")
+        except Exception as send_error:
+            logger.warning(f"Failed to send watch error to chat {chat_id}: {send_error}")
+
+    backoff = min(MAX_POLL_SECS, POLL_SECS * 2 ** (streak - 1))
+    return backoff * random.uniform(1.0, 1.3)
+
+
+async def watch_loop(chat_id: int, league: str, bot):
+    """Main stateful watch loop with phase-based polling; runs until its task is cancelled."""
     logger.info(f"Started stateful watch loop for chat {chat_id}, league '{league}'")
     save_counter = 0
+    overrun_polls = 0
     is_resumed = FIRST_POLL_AFTER_RESUME.get(chat_id, False)
 
     try:
         # Determine initial phase
-        async with make_session() as session:
-            rounds = await get_rounds(session, league)
-            latest_round = pick_latest_round(rounds) if rounds else None
-            
+        session = await get_session()
+        rounds = await get_rounds(session, league)
+        latest_round = pick_latest_round(rounds) if rounds else None
+        
         phase_name = determine_phase_from_round(latest_round)
         try:
             current_phase = WatcherPhase(phase_name.lower())
@@ -1217,7 +1275,9 @@ async def watch_loop(chat_id: int, league: str, bot, stop_event: asyncio.Event):
         except Exception:
             pass
 
-        while not stop_event.is_set():
+        while True:
+            tick_started = time.monotonic()
+            error_backoff = 0.0
             try:
                 save_counter += 1
                 
@@ -1239,39 +1299,40 @@ async def watch_loop(chat_id: int, league: str, bot, stop_event: asyncio.Event):
                     FIRST_POLL_AFTER_RESUME[chat_id] = False
                     is_resumed = False
 
+                ERROR_STREAKS.pop(chat_id, None)
+
             except PermissionError as e:
                 await bot.send_message(chat_id, f"🔐 {e}")
                 break
             except Exception as e:
                 logger.error(f"Watch error for chat {chat_id}: {e}")
-                await bot.send_message(chat_id, f"❌ Watch error: {e}")
+                error_backoff = await _report_watch_error(bot, chat_id, str(e))
 
-            # Wait for next poll or stop event
+            # Wait for next poll; /stopwatch and /unwatch stop us by cancelling the task
             poll_interval = get_phase_poll_interval(current_phase, chat_id)
             
             if poll_interval is None:
-                # Event-driven phase (MARKET_OPEN) - wait for phase change event or stop event
+                # Event-driven phase (MARKET_OPEN) - wait for phase change event
                 phase_change_event = PHASE_CHANGE_EVENTS.get(chat_id)
                 if phase_change_event:
-                    done, pending = await asyncio.wait(
-                        [
-                            asyncio.create_task(stop_event.wait()),
-                            asyncio.create_task(phase_change_event.wait())
-                        ],
-                        return_when=asyncio.FIRST_COMPLETED
-                    )
-                    # Cancel pending tasks
-                    for task in pending:
-                        task.cancel()
+                    await phase_change_event.wait()
                 else:
-                    # Fallback - just wait for stop event
-                    await stop_event.wait()
+                    # Fallback - nothing to wake us, park until cancelled
+                    await asyncio.get_running_loop().create_future()
             else:
-                # Polling phase - wait for timeout or stop event
-                try:
-                    await asyncio.wait_for(stop_event.wait(), timeout=poll_interval)
-                except asyncio.TimeoutError:
-                    pass
+                # Polling phase - wait for timeout or stop event. Time spent polling
+                # counts toward the interval; an overrun skips the missed slot
+                # instead of firing the next poll back-to-back.
+                delay = poll_interval - (time.monotonic() - tick_started)
+                if delay <= 0:
+                    delay = poll_interval
+                    overrun_polls += 1
+                    if overrun_polls >= 3:
+                        logger.warning(f"⏱️ Polls for chat {chat_id} are falling behind: {overrun_polls} in a row took longer than {poll_interval}s")
+                else:
+                    overrun_polls = 0
+                delay = max(delay, error_backoff)
+                await asyncio.sleep(delay)
 
     finally:
         # Always cleanup on exit
@@ -1284,11 +1345,6 @@ def start_watcher(chat_id: int, league: str, bot):
     if chat_id in WATCHERS:
         return  # Already running
         
-    stop_event = asyncio.Event()
-    
-    async def runner():
-        await watch_loop(chat_id, league, bot, stop_event)
-    
-    WATCHERS[chat_id] = asyncio.create_task(runner())
+    WATCHERS[chat_id] = asyncio.create_task(watch_loop(chat_id, league, bot), name=f"watcher-{chat_id}")
     logger.info(f"Started watcher for chat {chat_id}, league '{league}'")
 